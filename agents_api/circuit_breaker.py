@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, List
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class HostCircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    A host opens after `failure_threshold` failures within `window_seconds`.
+    While open, `allow()` returns False until `cooldown_seconds` have passed;
+    then a single half-open probe is let through. A successful probe closes
+    the circuit, a failed one re-opens it for another cooldown. A probe that
+    ends without an outcome should call `release_probe()`; as a backstop, a
+    probe older than `probe_timeout_seconds` is considered abandoned.
+
+    Thread-safe: outcomes are recorded both from the event loop and from
+    `asyncio.to_thread` workers.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        window_seconds: float = 60.0,
+        cooldown_seconds: float = 30.0,
+        probe_timeout_seconds: float = 60.0,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.window_seconds = window_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.probe_timeout_seconds = probe_timeout_seconds
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Dict[str, Any]] = {}
+
+    def _entry(self, host: str) -> Dict[str, Any]:
+        entry = self._hosts.get(host)
+        if entry is None:
+            entry = {
+                "state": CLOSED,
+                "failures": [],
+                "opened_at": None,
+                "probe_in_flight": False,
+                "probe_started_at": None,
+                "last_error": None,
+            }
+            self._hosts[host] = entry
+        return entry
+
+    def allow(self, host: str) -> bool:
+        with self._lock:
+            entry = self._entry(host)
+            if entry["state"] == CLOSED:
+                return True
+            now = time.monotonic()
+            if entry["state"] == OPEN:
+                if now - entry["opened_at"] < self.cooldown_seconds:
+                    return False
+                entry["state"] = HALF_OPEN
+                entry["probe_in_flight"] = False
+            # Half-open: only one probe at a time.
+            if entry["probe_in_flight"] and now - entry["probe_started_at"] < self.probe_timeout_seconds:
+                return False
+            entry["probe_in_flight"] = True
+            entry["probe_started_at"] = now
+            return True
+
+    def release_probe(self, host: str) -> None:
+        """Let another half-open probe through after one ended without recording an outcome."""
+        with self._lock:
+            entry = self._entry(host)
+            if entry["state"] == HALF_OPEN:
+                entry["probe_in_flight"] = False
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            entry = self._entry(host)
+            entry["state"] = CLOSED
+            entry["failures"] = []
+            entry["opened_at"] = None
+            entry["probe_in_flight"] = False
+
+    def record_failure(self, host: str, error: str | None = None) -> None:
+        with self._lock:
+            entry = self._entry(host)
+            now = time.monotonic()
+            entry["last_error"] = error
+            entry["probe_in_flight"] = False
+
+            if entry["state"] == HALF_OPEN:
+                entry["state"] = OPEN
+                entry["opened_at"] = now
+                return
+
+            failures: List[float] = [t for t in entry["failures"] if now - t < self.window_seconds]
+            failures.append(now)
+            entry["failures"] = failures
+            if len(failures) >= self.failure_threshold:
+                entry["state"] = OPEN
+                entry["opened_at"] = now
+
+    def state(self, host: str) -> Dict[str, Any]:
+        with self._lock:
+            return self._describe(host, self._entry(host))
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {host: self._describe(host, entry) for host, entry in self._hosts.items()}
+
+    def _describe(self, host: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        now = time.monotonic()
+        retry_after = None
+        if entry["state"] == OPEN and entry["opened_at"] is not None:
+            retry_after = max(0.0, round(self.cooldown_seconds - (now - entry["opened_at"]), 1))
+        return {
+            "host": host,
+            "state": entry["state"],
+            "recent_failures": len([t for t in entry["failures"] if now - t < self.window_seconds]),
+            "retry_after_seconds": retry_after,
+            "last_error": entry["last_error"],
+        }
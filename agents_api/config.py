@@ -22,6 +22,21 @@ SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY") or ""
 GOOGLE_SEARCH_API_KEY = os.getenv("GOOGLE_SEARCH_API_KEY") or ""
 GOOGLE_SEARCH_CX = os.getenv("GOOGLE_SEARCH_CX") or ""
 
+# Optional multi-page crawl (about/pricing/customers/careers) during research.
+WEB_CRAWL_ENABLED = os.getenv("WEB_CRAWL_ENABLED", "").lower() in ("1", "true", "yes")
+
+# Optional request profiling. PROFILING_ENABLED profiles every /research and
+# /web_navigate request; otherwise a request opts in with `X-Profile: 1` plus
+# `X-Admin-Token: <PROFILING_ADMIN_TOKEN>` (header opt-in is off when the token is unset).
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "").lower() in ("1", "true", "yes")
+PROFILING_ADMIN_TOKEN = os.getenv("PROFILING_ADMIN_TOKEN") or ""
+PROFILE_OUTPUT_DIR = os.getenv("PROFILE_OUTPUT_DIR", "profiles")
+PROFILE_FORMAT = os.getenv("PROFILE_FORMAT", "speedscope").lower()  # or 'html'
+
+# Event-loop lag monitor: logs the blocking stack when the loop stalls longer
+# than this many ms. 0 disables it; defaults to 100 ms when profiling is enabled.
+LOOP_LAG_THRESHOLD_MS = int(os.getenv("LOOP_LAG_THRESHOLD_MS") or (100 if PROFILING_ENABLED else 0))
+
 
 def ensure_supabase_config() -> None:
     if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import Any, Dict, List
+
+import numpy as np
+
+# What run_research needs to fill in, expressed as bag-of-words queries.
+EVIDENCE_FIELD_QUERIES: Dict[str, str] = {
+    "industry": "industry sector market vertical category platform company provides solutions for businesses",
+    "size": "employees team people headcount size founded customers companies worldwide offices funding series",
+    "hq": "headquarters headquartered based located hq office offices city country address",
+    "tools": "integrations integrates tools stack software platform api works with built on salesforce hubspot slack",
+    "initiatives": "launch launched announcing new initiative expansion hiring careers roadmap growth partnership",
+}
+EVIDENCE_CHUNK_CHARS = 400
+EVIDENCE_TOP_K = 8
+
+_STOPWORDS = {
+    "the", "and", "for", "with", "that", "this", "from", "are", "was", "our", "your", "you", "we",
+    "is", "in", "of", "to", "on", "at", "by", "an", "or", "as", "be", "it", "its", "can", "all",
+}
+_TOKEN_RE = re.compile(r"[a-z0-9]{2,}")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def _tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def chunk_text(text: str, max_chars: int = EVIDENCE_CHUNK_CHARS) -> List[str]:
+    """Split text into roughly `max_chars` chunks on sentence boundaries."""
+    chunks: List[str] = []
+    current = ""
+    for sentence in _SENTENCE_RE.split(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        while len(sentence) > max_chars:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}".strip()
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def collect_evidence_chunks(web_navigation: Dict[str, Any]) -> List[Dict[str, str]]:
+    """Chunk fetched page text and search snippets from a web_navigation context."""
+    candidates: List[Dict[str, str]] = []
+
+    pages: List[Dict[str, Any]] = []
+    if web_navigation.get("website"):
+        pages.append(web_navigation["website"])
+    pages.extend(web_navigation.get("pages") or [])
+
+    for page in pages:
+        if not page.get("ok"):
+            continue
+        source = str(page.get("url") or "")
+        header = " — ".join(part for part in (page.get("title"), page.get("description")) if part)
+        if header:
+            candidates.append({"source": source, "text": header})
+        body = page.get("text") or page.get("excerpt") or ""
+        for chunk in chunk_text(body):
+            candidates.append({"source": source, "text": chunk})
+
+    for result in (web_navigation.get("search") or {}).get("results", []):
+        text = " — ".join(part for part in (result.get("title"), result.get("snippet")) if part)
+        if text:
+            candidates.append({"source": str(result.get("url") or ""), "text": text})
+
+    # Boilerplate (nav, footers, repeated search snippets) often appears more than once.
+    seen: set[str] = set()
+    unique: List[Dict[str, str]] = []
+    for candidate in candidates:
+        if candidate["text"] in seen:
+            continue
+        seen.add(candidate["text"])
+        unique.append(candidate)
+    return unique
+
+
+def _tfidf_matrix(docs: List[List[str]], vocab: Dict[str, int], idf: np.ndarray) -> np.ndarray:
+    matrix = np.zeros((len(docs), len(vocab)), dtype=np.float32)
+    for row, tokens in enumerate(docs):
+        counts = Counter(token for token in tokens if token in vocab)
+        if not counts:
+            continue
+        cols = np.fromiter((vocab[token] for token in counts), dtype=np.int64, count=len(counts))
+        matrix[row, cols] = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+    matrix = np.log1p(matrix) * idf
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1.0, norms)
+
+
+def score_chunks(chunks: List[Dict[str, str]]) -> np.ndarray:
+    """
+    TF-IDF cosine similarity of every chunk against every field query.
+
+    Returns an array of shape (len(chunks), len(EVIDENCE_FIELD_QUERIES)).
+    """
+    chunk_tokens = [_tokenize(chunk["text"]) for chunk in chunks]
+    query_tokens = [_tokenize(query) for query in EVIDENCE_FIELD_QUERIES.values()]
+
+    vocab: Dict[str, int] = {}
+    for tokens in chunk_tokens + query_tokens:
+        for token in tokens:
+            vocab.setdefault(token, len(vocab))
+    if not vocab:
+        return np.zeros((len(chunks), len(query_tokens)), dtype=np.float32)
+
+    doc_freq = np.zeros(len(vocab), dtype=np.float32)
+    for tokens in chunk_tokens:
+        for token in set(tokens):
+            doc_freq[vocab[token]] += 1
+    idf = np.log((1 + len(chunks)) / (1 + doc_freq)) + 1
+
+    chunk_matrix = _tfidf_matrix(chunk_tokens, vocab, idf)
+    query_matrix = _tfidf_matrix(query_tokens, vocab, idf)
+    return chunk_matrix @ query_matrix.T
+
+
+def select_evidence(web_navigation: Dict[str, Any], top_k: int = EVIDENCE_TOP_K) -> List[Dict[str, Any]]:
+    """
+    Pick the `top_k` chunks most relevant to the research fields.
+
+    Each field first gets its best chunk so no field is crowded out; remaining
+    slots go to the highest scores overall. Chunks with no overlap are dropped.
+    """
+    chunks = collect_evidence_chunks(web_navigation)
+    if not chunks:
+        return []
+
+    scores = score_chunks(chunks)
+    fields = list(EVIDENCE_FIELD_QUERIES)
+    best = scores.max(axis=1)
+
+    selected: List[int] = []
+    for column in range(len(fields)):
+        index = int(scores[:, column].argmax())
+        if scores[index, column] > 0 and index not in selected:
+            selected.append(index)
+    for index in np.argsort(-best, kind="stable"):
+        if len(selected) >= top_k or best[index] <= 0:
+            break
+        if int(index) not in selected:
+            selected.append(int(index))
+    selected = selected[:top_k]
+
+    evidence: List[Dict[str, Any]] = []
+    for index in sorted(selected, key=lambda i: -best[i]):
+        evidence.append(
+            {
+                "source": chunks[index]["source"],
+                "text": chunks[index]["text"],
+                "field": fields[int(scores[index].argmax())],
+                "score": round(float(best[index]), 3),
+            }
+        )
+    return evidence
+
+
+def compact_web_navigation(web_navigation: Dict[str, Any], top_k: int = EVIDENCE_TOP_K) -> Dict[str, Any]:
+    """
+    Prompt-sized view of a web_navigation context.
+
+    Full page text, excerpts and raw search results are replaced by the
+    selected evidence chunks; only page titles/descriptions are kept.
+    """
+    website = web_navigation.get("website") or {}
+    compact: Dict[str, Any] = {
+        "subject": web_navigation.get("subject"),
+        "website": (
+            {key: website.get(key) for key in ("url", "title", "description")} if website.get("ok") else None
+        ),
+        "evidence": select_evidence(web_navigation, top_k=top_k),
+        "sources": web_navigation.get("sources", []),
+    }
+    if web_navigation.get("pages"):
+        compact["pages"] = [
+            {key: page.get(key) for key in ("url", "page_type", "title")}
+            for page in web_navigation["pages"]
+            if page.get("ok")
+        ]
+    return compact
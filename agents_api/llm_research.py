@@ -2,11 +2,13 @@ import json
 from typing import Any, Dict
 
 from .utils.safeparse import safe_parse_json
-from .utils.website_hint import infer_website_hint
+from .utils.website_hint import verify_website_hint_async
 
-from .config import MODEL_NAME, create_async_llm_client
+from .config import MODEL_NAME, WEB_CRAWL_ENABLED, create_async_llm_client
+from .evidence import compact_web_navigation
 from .models import PqlRecordIn, ResearchResult
-from .supabase_client import insert_row, update_row, log_activity, get_single_row
+from .research_scheduler import check_deadline
+from .supabase_client import call_rpc, insert_row, update_row, log_activity, get_single_row
 from .web_navigate import gather_subject_context_async
 
 client = create_async_llm_client()
@@ -18,7 +20,8 @@ Given basic account + contact context, infer structured information about the co
 and key contacts involved in the deal.
 
 You may receive web_navigation context from lightweight web navigation tools.
-Use it as supporting evidence when available. If web_navigation is missing or sparse,
+Its "evidence" list holds the page and search excerpts most relevant to the fields
+below, each tagged with its source URL. Use it as supporting evidence when available. If web_navigation is missing or sparse,
 proceed conservatively from the provided lead context.
 
 Respond ONLY in JSON with the following shape:
@@ -43,18 +46,85 @@ Respond ONLY in JSON with the following shape:
 }
 """
 
+RESEARCH_AND_DRAFT_SYSTEM_PROMPT = """
+You are a GTM research analyst researching product-qualified leads and drafting first-touch outreach.
+
+Given basic account + contact context, infer structured information about the company
+and key contacts involved in the deal, then write a short outreach email to the lead
+grounded in that research.
+
+You may receive web_navigation context from lightweight web navigation tools.
+Its "evidence" list holds the page and search excerpts most relevant to the fields
+below, each tagged with its source URL. Use it as supporting evidence when available.
+If web_navigation is missing or sparse, proceed conservatively from the provided lead context.
+
+Respond ONLY in JSON with the following shape:
+{
+  "company_info": {
+    "industry": "<string>",
+    "size_bucket": "<e.g. SMB, Mid-market, Enterprise>",
+    "hq_country": "<string>",
+    "key_initiatives": ["strings"],
+    "primary_product": "<string>",
+    "current_tools": ["strings"]
+  },
+  "key_contacts": [
+    {
+      "name": "<string or null>",
+      "title": "<string or null>",
+      "role_in_deal": "<economic_buyer|champion|user|other>",
+      "email": "<string or null>",
+      "notes": "<short text>"
+    }
+  ],
+  "email_draft": {
+    "subject": "<short subject line>",
+    "body": "<plain-text email under 150 words referencing the company's initiatives or tools>",
+    "proposed_offer": "<string or null>",
+    "reasoning": "<one or two sentences on why this angle fits the research>"
+  }
+}
+"""
+
+
+def _parse_email_draft(parsed: Any, to_email: str) -> Dict[str, Any] | None:
+    draft = parsed.get("email_draft") if isinstance(parsed, dict) else None
+    if not isinstance(draft, dict) or not draft.get("subject") or not draft.get("body"):
+        return None
+    return {
+        "to_email": to_email,
+        "subject": str(draft["subject"]),
+        "body": str(draft["body"]),
+        "proposed_offer": draft.get("proposed_offer"),
+        "ai_reasoning": draft.get("reasoning"),
+    }
+
 
 async def run_research(
     pql: PqlRecordIn,
     research_metadata: Dict[str, Any] | None = None,
+    deadline: float | None = None,
+    crawl: bool = WEB_CRAWL_ENABLED,
+    draft_email: bool = False,
 ) -> ResearchResult:
+    """
+    Research a PQL and persist the enrichment.
+
+    With `draft_email=True`, the same LLM call also writes an outreach draft,
+    and enrichment, draft and activity log are saved in one
+    `save_research_results` RPC instead of separate requests.
+    """
     raw = pql.raw_data or {}
-    website_hint = infer_website_hint(pql.email, pql.company_name)
+    # Only verified (DNS + HEAD) URLs are handed to the renderer; unverified guesses
+    # used to cost a full Playwright timeout plus the requests fallback.
+    website_hint = await verify_website_hint_async(pql.email, pql.company_name)
 
     subject = pql.company_name or pql.email
     web_navigation = await gather_subject_context_async(
         subject=subject,
         website_hint_url=website_hint.get("url"),
+        crawl=crawl,
+        include_text=True,
     )
 
     context = {
@@ -67,7 +137,8 @@ async def run_research(
         "last_active_date": pql.last_active_date,
         "research": research_metadata or {},
         "raw_data": raw,
-        "web_navigation": web_navigation,
+        # Only the top-ranked evidence chunks go into the prompt, not whole pages.
+        "web_navigation": compact_web_navigation(web_navigation),
     }
 
     user_prompt = (
@@ -77,11 +148,15 @@ async def run_research(
         f"Lead JSON:\n{json.dumps(context, ensure_ascii=False)}\n\n"
         "Return only the JSON object described in the instructions."
     )
+    system_prompt = RESEARCH_AND_DRAFT_SYSTEM_PROMPT if draft_email else RESEARCH_SYSTEM_PROMPT
+
+    # Drop stale work (e.g. the caller gave up) before paying for LLM tokens.
+    check_deadline(deadline, "LLM call")
 
     resp = await client.chat.completions.create(
         model=MODEL_NAME,
         messages=[
-            {"role": "system", "content": RESEARCH_SYSTEM_PROMPT},
+            {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ],
     )
@@ -108,25 +183,38 @@ async def run_research(
         "enrichment_source": research_source,
     }
 
-    # Upsert into existing enrichments table to avoid schema changes right now.
-    existing = get_single_row("enrichments", filters={"pql_id": pql.id})
-    if existing:
-        update_row("enrichments", existing["id"], payload)
+    activity_details = {
+        "company_info_keys": list(company_info.keys()),
+        "web_source_count": len(web_navigation.get("sources", [])),
+    }
+
+    email_draft = None
+    if draft_email:
+        email_draft = _parse_email_draft(parsed, pql.email)
+        activity_details["email_drafted"] = email_draft is not None
+        call_rpc(
+            "save_research_results",
+            {
+                "p_pql_id": pql.id,
+                "p_enrichment": payload,
+                "p_email_draft": email_draft,
+                "p_activity_details": activity_details,
+            },
+        )
     else:
-        insert_row("enrichments", payload)
-
-    log_activity(
-        pql.id,
-        "researched",
-        {
-            "company_info_keys": list(company_info.keys()),
-            "web_source_count": len(web_navigation.get("sources", [])),
-        },
-    )
+        # Upsert into existing enrichments table to avoid schema changes right now.
+        existing = get_single_row("enrichments", filters={"pql_id": pql.id})
+        if existing:
+            update_row("enrichments", existing["id"], payload)
+        else:
+            insert_row("enrichments", payload)
+
+        log_activity(pql.id, "researched", activity_details)
 
     return ResearchResult(
         pql_id=pql.id,
         company_info=company_info,
         key_contacts=key_contacts,
         research_source=research_source,
+        email_draft=email_draft,
     )
@@ -1,11 +1,23 @@
-from fastapi import FastAPI, HTTPException
+import hashlib
+import json
+
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config import ensure_supabase_config, create_async_llm_client, MODEL_NAME, LLM_PROVIDER
 from .llm_research import run_research
-from .models import PqlRecordIn, ResearchRequest, ResearchResult
+from .models import ResearchBatchRequest, ResearchPriority, ResearchRequest, ResearchResult
+from .pql_import import IMPORT_CHUNK_SIZE, MAX_IMPORT_CHUNK_SIZE, import_pqls_stream
+from .pql_listing import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError, list_pql_summaries
+from .profiling import create_loop_lag_monitor, save_request_profile, should_profile, start_request_profiler
+from .research_batch import PQL_RESEARCH_COLUMNS, pql_from_row, research_pending, research_pql_ids
+from .research_scheduler import LaneFullError, ResearchDeadlineExceeded, research_scheduler, resolve_deadline
 from .supabase_client import get_single_row
-from .web_navigate import gather_subject_context_async, google_search_top_links_async
+from .web_navigate import (
+    circuit_breaker_snapshot,
+    gather_subject_context_async,
+    google_search_top_links_async,
+)
 
 
 OPENAPI_TAGS = [
@@ -17,6 +29,10 @@ OPENAPI_TAGS = [
         "name": "Research",
         "description": "Endpoints that run the lead research workflow.",
     },
+    {
+        "name": "PQLs",
+        "description": "Endpoints for bulk PQL ingestion and listing.",
+    },
     {
         "name": "System",
         "description": "System health and connectivity checks.",
@@ -38,43 +54,170 @@ app.add_middleware(
 )
 
 
+_loop_lag_monitor = create_loop_lag_monitor()
+
+
 @app.on_event("startup")
-def _on_startup() -> None:
+async def _on_startup() -> None:
     # Fail fast if Supabase is not configured.
     ensure_supabase_config()
+    if _loop_lag_monitor is not None:
+        _loop_lag_monitor.start()
+
+
+@app.on_event("shutdown")
+async def _on_shutdown() -> None:
+    if _loop_lag_monitor is not None:
+        _loop_lag_monitor.stop()
+
+
+@app.middleware("http")
+async def _profile_requests(request: Request, call_next):
+    if not should_profile(request.url.path, request.headers):
+        return await call_next(request)
+
+    profiler = start_request_profiler()
+    if profiler is None:
+        return await call_next(request)
+    try:
+        response = await call_next(request)
+    finally:
+        profile_path = await save_request_profile(profiler, request.url.path)
+    response.headers["X-Profile-Path"] = profile_path
+    return response
 
 
 @app.post("/research", response_model=ResearchResult, tags=["Research"])
-async def research(pql_id: str, body: ResearchRequest | None = None) -> ResearchResult:
+async def research(
+    pql_id: str,
+    body: ResearchRequest | None = None,
+    priority: ResearchPriority = "interactive",
+    deadline_seconds: float | None = Query(None, gt=0),
+) -> ResearchResult:
     """
     Research for a single PQL.
 
     This route performs company/contact research and writes results to Supabase.
+    The job runs on the `priority` lane; a full lane returns 429 with Retry-After,
+    and work that misses its deadline is dropped before the LLM call (504).
     """
-    _ = body  # kept for backward compatibility with existing frontend payloads
+    draft_email = bool(body and body.draft_email)
 
-    pql_row = get_single_row("pqls", filters={"id": pql_id})
+    pql_row = get_single_row("pqls", filters={"id": pql_id}, columns=PQL_RESEARCH_COLUMNS)
     if not pql_row:
         raise HTTPException(status_code=404, detail="PQL not found")
 
-    pql = PqlRecordIn(
-        id=pql_row["id"],
-        email=pql_row["email"],
-        company_name=pql_row.get("company_name"),
-        raw_data=pql_row.get("raw_data") or {},
-        status="pending",
-    )
+    pql = pql_from_row(pql_row)
+
+    deadline = resolve_deadline(priority, deadline_seconds)
+    try:
+        future = research_scheduler.submit(
+            priority,
+            lambda: run_research(pql, deadline=deadline, draft_email=draft_email),
+            deadline=deadline,
+            label=pql.id,
+        )
+    except LaneFullError as exc:
+        raise HTTPException(
+            status_code=429,
+            detail=str(exc),
+            headers={"Retry-After": str(exc.retry_after_seconds)},
+        )
 
-    result = await run_research(pql)
+    try:
+        result = await future
+    except ResearchDeadlineExceeded as exc:
+        raise HTTPException(status_code=504, detail=str(exc))
     return result
 
 
+@app.post("/research/batch", tags=["Research"])
+async def research_batch(body: ResearchBatchRequest, priority: ResearchPriority = "bulk") -> dict:
+    """
+    Queue research for many PQLs.
+
+    PQLs are prefetched with one `id=in.(...)` request per 100 ids rather than
+    one GET per lead. Returns immediately with enqueue counts, missing ids and
+    ids not attempted because the lane filled.
+    """
+    return await research_pql_ids(body.pql_ids, priority, draft_email=body.draft_email)
+
+
+@app.post("/research/pending", tags=["Research"])
+async def research_pending_pqls(
+    priority: ResearchPriority = "background",
+    limit: int = Query(500, ge=1, le=5000),
+    draft_email: bool = False,
+    only_unresearched: bool = True,
+) -> dict:
+    """
+    Worker entry point: page through pending PQLs (keyset pagination) and queue research.
+    """
+    return await research_pending(
+        priority,
+        limit,
+        draft_email=draft_email,
+        only_unresearched=only_unresearched,
+    )
+
+
+@app.get("/pqls", tags=["PQLs"])
+async def list_pqls(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    status: str | None = None,
+) -> Response:
+    """
+    Paginated PQL summaries for the command center, newest first.
+
+    Returns lightweight columns plus enrichment status (no raw_data) and a
+    `next_cursor` for keyset pagination. Responses carry an ETag; a matching
+    If-None-Match returns 304 with no body.
+    """
+    try:
+        payload = await list_pql_summaries(limit=limit, cursor=cursor, status=status)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    body = json.dumps(payload, separators=(",", ":"), default=str).encode()
+    etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@app.post("/pqls/import", tags=["PQLs"])
+async def import_pqls(
+    request: Request,
+    chunk_size: int = Query(IMPORT_CHUNK_SIZE, ge=1, le=MAX_IMPORT_CHUNK_SIZE),
+    research: bool = True,
+    draft_email: bool = False,
+) -> dict:
+    """
+    Stream a raw CSV request body into `pqls`.
+
+    Rows are mapped server-side and inserted in chunks of `chunk_size`; research
+    for each chunk starts in the background as soon as the chunk is stored.
+    With `draft_email`, research also writes an outreach draft per lead.
+    """
+    return await import_pqls_stream(
+        request.stream(),
+        chunk_size=chunk_size,
+        research=research,
+        draft_email=draft_email,
+    )
+
+
 @app.get("/web_navigate", tags=["Web-Nav"])
-async def web_navigate(subject: str, website_hint_url: str | None = None) -> dict:
+async def web_navigate(subject: str, website_hint_url: str | None = None, crawl: bool = False) -> dict:
     """
     Direct test endpoint for the web navigation module.
     """
-    return await gather_subject_context_async(subject=subject, website_hint_url=website_hint_url)
+    return await gather_subject_context_async(subject=subject, website_hint_url=website_hint_url, crawl=crawl)
 
 
 @app.get("/web_nav_google_search", tags=["Web-Nav"])
@@ -90,6 +233,22 @@ async def health() -> dict:
     return {"status": "ok", "provider": LLM_PROVIDER, "model": MODEL_NAME}
 
 
+@app.get("/debug/circuit_breakers", tags=["System"])
+async def debug_circuit_breakers() -> dict:
+    """
+    Per-host circuit breaker state for web navigation (page fetches and Google search).
+    """
+    return {"hosts": circuit_breaker_snapshot()}
+
+
+@app.get("/debug/research_lanes", tags=["System"])
+async def debug_research_lanes() -> dict:
+    """
+    Queue depth, running jobs and weights for each research priority lane.
+    """
+    return research_scheduler.snapshot()
+
+
 @app.get("/llm-test", tags=["System"])
 async def llm_test() -> dict:
     """
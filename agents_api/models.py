@@ -1,8 +1,11 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel
 
 
+ResearchPriority = Literal["interactive", "bulk", "background"]
+
+
 class PqlRecordIn(BaseModel):
     id: str
     email: str
@@ -21,7 +24,14 @@ class ResearchResult(BaseModel):
     company_info: Dict[str, Any]
     key_contacts: List[Dict[str, Any]]
     research_source: str
+    email_draft: Optional[Dict[str, Any]] = None
 
 
 class ResearchRequest(BaseModel):
     qualification_threshold: Optional[int] = None
+    draft_email: bool = False
+
+
+class ResearchBatchRequest(BaseModel):
+    pql_ids: List[str]
+    draft_email: bool = False
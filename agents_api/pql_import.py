@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+import codecs
+import csv
+import math
+from typing import Any, AsyncIterator, Dict, List
+
+from .research_batch import enqueue_research
+from .research_scheduler import BULK
+from .supabase_client import insert_rows
+
+IMPORT_CHUNK_SIZE = 200
+MAX_IMPORT_CHUNK_SIZE = 1000
+
+
+def _first_present(row: Dict[str, str], *keys: str) -> Any:
+    """Mirror JS `a ?? b ?? c`: first key that exists in the row, even if empty."""
+    for key in keys:
+        if key in row:
+            return row[key]
+    return None
+
+
+def _first_truthy(row: Dict[str, str], *keys: str) -> Any:
+    """Mirror JS `a || b || c`: first non-empty value."""
+    for key in keys:
+        value = row.get(key)
+        if value:
+            return value
+    return None
+
+
+def _parse_usage_score(value: Any) -> float | None:
+    if value is None or value == "":
+        return None
+    try:
+        score = float(value)
+    except (TypeError, ValueError):
+        return None
+    # "nan"/"inf" parse but are not valid JSON; the browser uploader sent null for them.
+    return score if math.isfinite(score) else None
+
+
+def map_csv_row(row: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Map one CSV row to a `pqls` insert payload.
+
+    Reproduces the header aliases used by the frontend CSV uploader.
+    """
+    usage_raw = _first_present(
+        row,
+        "product_usage_score",
+        "usage_score",
+        "score",
+        "Usage Score (1-10)",
+        "Usage Score",
+    )
+
+    # Only send values that are already in a date-like field. Free-text values
+    # like "2 hours ago" stay in raw_data and are interpreted later.
+    last_active = _first_present(row, "last_active_date", "last_active")
+
+    return {
+        "email": _first_truthy(row, "email", "Email") or "",
+        "company_name": _first_truthy(
+            row,
+            "company_name",
+            "Company",
+            "company",
+            "Company Name",
+            "Company name",
+        ),
+        "product_usage_score": _parse_usage_score(usage_raw),
+        "last_active_date": last_active or None,
+        "raw_data": row,
+        "status": "pending",
+    }
+
+
+def _parse_csv_line(line: str) -> List[str]:
+    fields = next(csv.reader([line]), [])
+    return [field.strip() for field in fields]
+
+
+def _split_lines(buffer: str, final: bool) -> tuple[List[str], str]:
+    *complete, rest = buffer.split("\n")
+    if final:
+        complete.append(rest)
+        rest = ""
+    return [line.strip() for line in complete if line.strip()], rest
+
+
+async def iter_csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[Dict[str, str]]:
+    """
+    Incrementally decode an uploaded CSV body into header-keyed rows.
+
+    Records are line-delimited, matching the browser uploader; blank lines are skipped.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    headers: List[str] | None = None
+    buffer = ""
+    final = False
+
+    chunk_iter = chunks.__aiter__()
+    while not final:
+        try:
+            buffer += decoder.decode(await chunk_iter.__anext__())
+        except StopAsyncIteration:
+            buffer += decoder.decode(b"", final=True)
+            final = True
+
+        lines, buffer = _split_lines(buffer, final)
+        for line in lines:
+            values = _parse_csv_line(line)
+            if headers is None:
+                headers = values
+                continue
+            yield {h: values[i] if i < len(values) else "" for i, h in enumerate(headers)}
+
+
+async def _flush_chunk(
+    index: int,
+    pending: List[Dict[str, Any]],
+    report: Dict[str, Any],
+    research: bool,
+    draft_email: bool,
+) -> None:
+    chunk_report: Dict[str, Any] = {"index": index, "rows": len(pending), "inserted": 0}
+    try:
+        inserted = await asyncio.to_thread(insert_rows, "pqls", pending)
+    except Exception as exc:
+        chunk_report["error"] = str(exc)
+        report["failed"] += len(pending)
+    else:
+        chunk_report["inserted"] = len(inserted)
+        report["inserted"] += len(inserted)
+        if research and inserted:
+            accepted = enqueue_research(inserted, BULK, draft_email=draft_email)
+            chunk_report["research_enqueued"] = accepted
+            report["research_enqueued"] += accepted
+            report["research_rejected"] += len(inserted) - accepted
+    report["chunks"].append(chunk_report)
+
+
+async def import_pqls_stream(
+    chunks: AsyncIterator[bytes],
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    research: bool = True,
+    draft_email: bool = False,
+) -> Dict[str, Any]:
+    """
+    Stream a CSV body into `pqls` in fixed-size chunks.
+
+    Research for each chunk is scheduled as soon as its insert succeeds, so
+    ingestion of later chunks overlaps with research of earlier ones.
+    """
+    chunk_size = max(1, min(chunk_size, MAX_IMPORT_CHUNK_SIZE))
+    report: Dict[str, Any] = {
+        "total_rows": 0,
+        "inserted": 0,
+        "failed": 0,
+        "research_enqueued": 0,
+        "research_rejected": 0,
+        "chunks": [],
+    }
+
+    pending: List[Dict[str, Any]] = []
+    async for row in iter_csv_rows(chunks):
+        report["total_rows"] += 1
+        pending.append(map_csv_row(row))
+        if len(pending) >= chunk_size:
+            await _flush_chunk(len(report["chunks"]), pending, report, research, draft_email)
+            pending = []
+
+    if pending:
+        await _flush_chunk(len(report["chunks"]), pending, report, research, draft_email)
+
+    return report
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import binascii
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from .supabase_client import get_rows_page
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# raw_data keys the review queue uses for a display name, in priority order.
+# Selected as JSON paths so the (potentially large) raw_data blob is never transferred.
+_NAME_KEYS = ("name", "Name", "full_name", "fullName", "Full Name")
+_FIRST_NAME_KEYS = ("first_name", "firstName", "First Name", "first name")
+_LAST_NAME_KEYS = ("last_name", "lastName", "Last Name", "last name")
+_COMPANY_KEYS = ("Company Name", "Company name", "Company", "company_name", "company")
+
+_RAW_KEYS = _NAME_KEYS + _FIRST_NAME_KEYS + _LAST_NAME_KEYS + _COMPANY_KEYS
+_RAW_ALIASES = {key: f"raw_{index}" for index, key in enumerate(_RAW_KEYS)}
+
+PQL_SUMMARY_COLUMNS = ",".join(
+    [
+        "id",
+        "email",
+        "company_name",
+        "product_usage_score",
+        "last_active_date",
+        "status",
+        "qualification_result",
+        "created_at",
+        "updated_at",
+        "enrichments(enrichment_source,created_at)",
+    ]
+    + [f'{alias}:raw_data->>"{key}"' for key, alias in _RAW_ALIASES.items()]
+)
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(cursor: Optional[Tuple[Any, Any]]) -> Optional[str]:
+    if cursor is None:
+        return None
+    return base64.urlsafe_b64encode(json.dumps(list(cursor)).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[Any, Any]]:
+    if not cursor:
+        return None
+    try:
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError, TypeError):
+        raise InvalidCursorError("Invalid cursor.")
+    return created_at, row_id
+
+
+def _first_raw(row: Dict[str, Any], keys: Tuple[str, ...]) -> str:
+    for key in keys:
+        value = row.get(_RAW_ALIASES[key])
+        if value:
+            return str(value).strip()
+    return ""
+
+
+def _summarize(row: Dict[str, Any]) -> Dict[str, Any]:
+    combined_name = f"{_first_raw(row, _FIRST_NAME_KEYS)} {_first_raw(row, _LAST_NAME_KEYS)}".strip()
+    enrichments = row.get("enrichments") or []
+    enrichment = enrichments[0] if enrichments else None
+    return {
+        "id": row["id"],
+        "email": row.get("email"),
+        "company_name": row.get("company_name") or _first_raw(row, _COMPANY_KEYS) or None,
+        "display_name": _first_raw(row, _NAME_KEYS) or combined_name or None,
+        "product_usage_score": row.get("product_usage_score"),
+        "last_active_date": row.get("last_active_date"),
+        "status": row.get("status"),
+        "qualification_result": row.get("qualification_result"),
+        "created_at": row.get("created_at"),
+        "updated_at": row.get("updated_at"),
+        "enrichment_status": "researched" if enrichment else "pending",
+        "enrichment_source": enrichment.get("enrichment_source") if enrichment else None,
+        "enriched_at": enrichment.get("created_at") if enrichment else None,
+    }
+
+
+async def list_pql_summaries(
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    One page of PQL summaries, newest first, keyset-paginated on (created_at, id).
+    """
+    rows, next_cursor = await asyncio.to_thread(
+        get_rows_page,
+        "pqls",
+        columns=PQL_SUMMARY_COLUMNS,
+        filters={"status": status} if status else None,
+        after=decode_cursor(cursor),
+        descending=True,
+        limit=max(1, min(limit, MAX_PAGE_SIZE)),
+    )
+    items: List[Dict[str, Any]] = [_summarize(row) for row in rows]
+    return {"items": items, "next_cursor": encode_cursor(next_cursor)}
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import hmac
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import traceback
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+from .config import (
+    LOOP_LAG_THRESHOLD_MS,
+    PROFILE_FORMAT,
+    PROFILE_OUTPUT_DIR,
+    PROFILING_ADMIN_TOKEN,
+    PROFILING_ENABLED,
+)
+
+try:
+    from pyinstrument import Profiler
+    from pyinstrument.renderers import HTMLRenderer, SpeedscopeRenderer
+except Exception:  # pragma: no cover - optional dependency guard
+    Profiler = None
+    HTMLRenderer = None
+    SpeedscopeRenderer = None
+
+logger = logging.getLogger(__name__)
+
+PROFILED_PATHS = ("/research", "/web_navigate")
+PROFILE_SAMPLE_INTERVAL_SECONDS = 0.001
+
+
+def should_profile(path: str, headers: Dict[str, str]) -> bool:
+    if path not in PROFILED_PATHS:
+        return False
+    if PROFILING_ENABLED:
+        return True
+    if headers.get("x-profile") != "1" or not PROFILING_ADMIN_TOKEN:
+        return False
+    # Bytes, because compare_digest rejects str with non-ASCII characters (headers are latin-1 decoded).
+    return hmac.compare_digest(headers.get("x-admin-token", "").encode(), PROFILING_ADMIN_TOKEN.encode())
+
+
+def start_request_profiler() -> Any | None:
+    if Profiler is None:
+        logger.warning("Profiling requested but pyinstrument is not installed (`pip install pyinstrument`).")
+        return None
+    profiler = Profiler(interval=PROFILE_SAMPLE_INTERVAL_SECONDS, async_mode="enabled")
+    profiler.start()
+    return profiler
+
+
+def _write_profile(session: Any, path: str) -> str:
+    os.makedirs(PROFILE_OUTPUT_DIR, exist_ok=True)
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    slug = re.sub(r"[^a-z0-9]+", "_", path.lower()).strip("_") or "root"
+    if PROFILE_FORMAT == "html":
+        renderer, extension = HTMLRenderer(), "html"
+    else:
+        renderer, extension = SpeedscopeRenderer(), "speedscope.json"
+
+    file_path = os.path.join(PROFILE_OUTPUT_DIR, f"{stamp}_{slug}.{extension}")
+    with open(file_path, "w", encoding="utf-8") as handle:
+        handle.write(renderer.render(session))
+    logger.info("Saved request profile for %s to %s", path, file_path)
+    return file_path
+
+
+async def save_request_profile(profiler: Any, path: str) -> str:
+    """
+    Stop `profiler` and write a speedscope (default) or HTML flamegraph; returns the file path.
+
+    Rendering a large session takes long enough to stall the loop, so it runs in a worker thread.
+    """
+    session = profiler.stop()
+    return await asyncio.to_thread(_write_profile, session, path)
+
+
+class LoopLagMonitor:
+    """
+    Detects synchronous calls that block the event loop.
+
+    A heartbeat coroutine stamps the time every `interval` seconds; a watchdog
+    thread logs the loop thread's current stack when the heartbeat is late by
+    more than `threshold_ms`, once per stall.
+    """
+
+    def __init__(self, threshold_ms: int, interval: float = 0.05) -> None:
+        self.threshold = threshold_ms / 1000
+        self.interval = interval
+        self._last_beat = time.monotonic()
+        self._loop_thread_id: int | None = None
+        self._heartbeat: asyncio.Task | None = None
+        self._stop = threading.Event()
+
+    async def _beat(self) -> None:
+        while True:
+            self._last_beat = time.monotonic()
+            await asyncio.sleep(self.interval)
+
+    def _watch(self) -> None:
+        reported_beat = None
+        while not self._stop.wait(self.interval):
+            beat = self._last_beat
+            if beat == reported_beat or time.monotonic() - beat <= self.threshold + self.interval:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            reported_beat = beat
+            stack = "".join(traceback.format_stack(frame))
+            logger.warning(
+                "Event loop blocked for more than %.0f ms; current stack:\n%s",
+                self.threshold * 1000,
+                stack,
+            )
+
+    def start(self) -> None:
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._heartbeat = asyncio.get_running_loop().create_task(self._beat())
+        threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True).start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+
+
+def create_loop_lag_monitor() -> LoopLagMonitor | None:
+    if LOOP_LAG_THRESHOLD_MS <= 0:
+        return None
+    return LoopLagMonitor(LOOP_LAG_THRESHOLD_MS)
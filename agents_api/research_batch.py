@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List
+
+from .llm_research import run_research
+from .models import PqlRecordIn
+from .research_scheduler import LaneFullError, log_job_failure, research_scheduler
+from .supabase_client import get_rows, get_rows_page
+
+logger = logging.getLogger(__name__)
+
+# Only what run_research reads; skips qualification_result, agent_metadata, etc.
+PQL_RESEARCH_COLUMNS = "id,email,company_name,product_usage_score,last_active_date,raw_data,created_at"
+# Ids per `id=in.(...)` request, keeps the query string well under URL limits.
+PREFETCH_BATCH_SIZE = 100
+PENDING_PAGE_SIZE = 100
+
+# PQLs queued or running in this process. `run_research` never moves a PQL out of
+# `pending`, so without this every worker pass would queue the same rows again.
+_inflight_pql_ids: set[str] = set()
+
+
+def pql_from_row(row: Dict[str, Any]) -> PqlRecordIn:
+    return PqlRecordIn(
+        id=row["id"],
+        email=row["email"],
+        company_name=row.get("company_name"),
+        product_usage_score=row.get("product_usage_score"),
+        last_active_date=row.get("last_active_date"),
+        raw_data=row.get("raw_data") or {},
+        status="pending",
+    )
+
+
+def _release_pql(pql_id: str) -> Callable[[asyncio.Future], None]:
+    return lambda _: _inflight_pql_ids.discard(pql_id)
+
+
+def skip_inflight(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop rows whose research is already queued or running."""
+    return [row for row in rows if row["id"] not in _inflight_pql_ids]
+
+
+def enqueue_research(rows: List[Dict[str, Any]], lane: str, draft_email: bool = False) -> int:
+    """Queue research for already-fetched rows on `lane`; returns how many were accepted."""
+    accepted = 0
+    for row in rows:
+        pql = pql_from_row(row)
+        try:
+            future = research_scheduler.submit(
+                lane,
+                lambda pql=pql: run_research(pql, draft_email=draft_email),
+                label=pql.id,
+            )
+        except LaneFullError:
+            logger.warning("Research lane %s full; %d PQLs left pending", lane, len(rows) - accepted)
+            break
+        _inflight_pql_ids.add(pql.id)
+        future.add_done_callback(_release_pql(pql.id))
+        future.add_done_callback(log_job_failure)
+        accepted += 1
+    return accepted
+
+
+async def research_pql_ids(pql_ids: List[str], lane: str, draft_email: bool = False) -> Dict[str, Any]:
+    """
+    Prefetch PQLs with one `id=in.(...)` request per PREFETCH_BATCH_SIZE ids and queue research.
+
+    Once the lane fills, later batches are not fetched: their ids are reported in
+    `not_attempted`, and `missing` only lists ids from batches that were fetched.
+    """
+    unique_ids = list(dict.fromkeys(pql_ids))
+    attempted = 0
+    found: set[str] = set()
+    already_queued = 0
+    enqueued = 0
+    for start in range(0, len(unique_ids), PREFETCH_BATCH_SIZE):
+        batch = unique_ids[start : start + PREFETCH_BATCH_SIZE]
+        rows = await asyncio.to_thread(
+            get_rows, "pqls", in_filters={"id": batch}, columns=PQL_RESEARCH_COLUMNS
+        )
+        attempted = start + len(batch)
+        found.update(row["id"] for row in rows)
+        fresh = skip_inflight(rows)
+        already_queued += len(rows) - len(fresh)
+        accepted = enqueue_research(fresh, lane, draft_email)
+        enqueued += accepted
+        if accepted < len(fresh):
+            break
+
+    return {
+        "requested": len(unique_ids),
+        "found": len(found),
+        "enqueued": enqueued,
+        "already_queued": already_queued,
+        "rejected": len(found) - enqueued - already_queued,
+        "missing": [pql_id for pql_id in unique_ids[:attempted] if pql_id not in found],
+        "not_attempted": unique_ids[attempted:],
+    }
+
+
+async def research_pending(
+    lane: str,
+    limit: int,
+    draft_email: bool = False,
+    only_unresearched: bool = True,
+) -> Dict[str, Any]:
+    """
+    Page through pending PQLs (oldest first, keyset on created_at/id) and queue up to `limit` of them.
+
+    With `only_unresearched`, PQLs that already have an enrichment row are skipped
+    server-side via an anti-join on the embedded `enrichments` resource. PQLs whose
+    research is already queued or running are skipped and paged past.
+    """
+    columns = PQL_RESEARCH_COLUMNS
+    params: Dict[str, str] = {}
+    if only_unresearched:
+        columns += ",enrichments(id)"
+        params["enrichments"] = "is.null"
+
+    after = None
+    fetched = 0
+    already_queued = 0
+    enqueued = 0
+    rejected = 0
+    pages = 0
+    while enqueued < limit:
+        rows, after = await asyncio.to_thread(
+            get_rows_page,
+            "pqls",
+            columns=columns,
+            filters={"status": "pending"},
+            params=params,
+            after=after,
+            limit=PENDING_PAGE_SIZE,
+        )
+        pages += 1
+        fetched += len(rows)
+        fresh = skip_inflight(rows)
+        already_queued += len(rows) - len(fresh)
+        # Take only what is left of `limit`; the rest of the page stays pending for the next pass.
+        fresh = fresh[: limit - enqueued]
+        accepted = enqueue_research(fresh, lane, draft_email)
+        enqueued += accepted
+        if accepted < len(fresh):
+            rejected = len(fresh) - accepted
+            break
+        if after is None:
+            break
+
+    return {
+        "fetched": fetched,
+        "enqueued": enqueued,
+        "already_queued": already_queued,
+        "rejected": rejected,
+        "pages": pages,
+    }
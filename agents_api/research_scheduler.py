@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+BACKGROUND = "background"
+
+# Share of worker slots each lane gets when all lanes are busy.
+LANE_WEIGHTS: Dict[str, int] = {INTERACTIVE: 6, BULK: 3, BACKGROUND: 1}
+# Queued (not yet running) jobs per lane before new submissions are rejected.
+LANE_MAX_QUEUED: Dict[str, int] = {INTERACTIVE: 50, BULK: 5000, BACKGROUND: 1000}
+# Deadline applied when the caller does not pass one. None means no deadline.
+LANE_DEFAULT_DEADLINE_SECONDS: Dict[str, float | None] = {INTERACTIVE: 120.0, BULK: None, BACKGROUND: None}
+MAX_CONCURRENT_RESEARCH = 4
+# Worker slots bulk/background may never occupy, so an interactive job does not
+# wait behind a full pool of long-running import jobs.
+RESERVED_INTERACTIVE_WORKERS = 1
+
+
+class LaneFullError(Exception):
+    def __init__(self, lane: str, retry_after_seconds: int) -> None:
+        super().__init__(f"Research lane '{lane}' is full.")
+        self.lane = lane
+        self.retry_after_seconds = retry_after_seconds
+
+
+class ResearchDeadlineExceeded(Exception):
+    pass
+
+
+def check_deadline(deadline: float | None, stage: str) -> None:
+    """Raise if a `time.monotonic()` deadline has already passed."""
+    if deadline is not None and time.monotonic() > deadline:
+        raise ResearchDeadlineExceeded(f"Research deadline exceeded before {stage}.")
+
+
+@dataclass
+class _Job:
+    run: Callable[[], Awaitable[Any]]
+    future: asyncio.Future
+    deadline: float | None
+    label: str | None = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class ResearchScheduler:
+    """
+    Weighted fair scheduler for research jobs.
+
+    Jobs are queued in priority lanes and drained by a fixed pool of workers
+    using smooth weighted round-robin, so interactive requests keep most of
+    the capacity during bulk imports without starving the other lanes.
+    `reserved_interactive` slots are held back from the other lanes entirely.
+    """
+
+    def __init__(
+        self,
+        weights: Dict[str, int] = LANE_WEIGHTS,
+        max_queued: Dict[str, int] = LANE_MAX_QUEUED,
+        concurrency: int = MAX_CONCURRENT_RESEARCH,
+        reserved_interactive: int = RESERVED_INTERACTIVE_WORKERS,
+    ) -> None:
+        self.weights = dict(weights)
+        self.max_queued = dict(max_queued)
+        self.concurrency = concurrency
+        self.reserved_interactive = min(reserved_interactive, concurrency - 1)
+        self._lanes: Dict[str, Deque[_Job]] = {lane: deque() for lane in self.weights}
+        self._current: Dict[str, int] = {lane: 0 for lane in self.weights}
+        self._running: Dict[str, int] = {lane: 0 for lane in self.weights}
+        self._avg_job_seconds = 10.0
+        self._wakeup: asyncio.Event | None = None
+        self._workers: List[asyncio.Task] = []
+
+    def _ensure_workers(self) -> None:
+        if self._workers:
+            return
+        self._wakeup = asyncio.Event()
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    def _retry_after(self, lane: str) -> int:
+        queued = len(self._lanes[lane])
+        share = self.weights[lane] / sum(self.weights.values())
+        capacity = self.concurrency if lane == INTERACTIVE else self.concurrency - self.reserved_interactive
+        slots = max(1.0, capacity * share)
+        return max(1, math.ceil(queued * self._avg_job_seconds / slots))
+
+    def submit(
+        self,
+        lane: str,
+        run: Callable[[], Awaitable[Any]],
+        *,
+        deadline: float | None = None,
+        label: str | None = None,
+    ) -> asyncio.Future:
+        """
+        Queue `run` on `lane` and return a future for its result.
+
+        Raises LaneFullError immediately if the lane is at capacity.
+        """
+        if lane not in self._lanes:
+            raise ValueError(f"Unknown research lane: {lane}")
+        if len(self._lanes[lane]) >= self.max_queued[lane]:
+            raise LaneFullError(lane, self._retry_after(lane))
+
+        self._ensure_workers()
+        future = asyncio.get_running_loop().create_future()
+        self._lanes[lane].append(_Job(run=run, future=future, deadline=deadline, label=label))
+        self._wakeup.set()
+        return future
+
+    def _eligible_lanes(self) -> List[str]:
+        non_interactive_running = sum(n for lane, n in self._running.items() if lane != INTERACTIVE)
+        non_interactive_full = non_interactive_running >= self.concurrency - self.reserved_interactive
+        return [
+            lane
+            for lane, jobs in self._lanes.items()
+            if jobs and (lane == INTERACTIVE or not non_interactive_full)
+        ]
+
+    def _next_job(self) -> tuple[str, _Job]:
+        active = self._eligible_lanes()
+        total = sum(self.weights[lane] for lane in active)
+        for lane in active:
+            self._current[lane] += self.weights[lane]
+        chosen = max(active, key=lambda lane: self._current[lane])
+        self._current[chosen] -= total
+        return chosen, self._lanes[chosen].popleft()
+
+    async def _worker(self) -> None:
+        while True:
+            while not self._eligible_lanes():
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            lane, job = self._next_job()
+            if job.future.cancelled():
+                continue
+            if job.deadline is not None and time.monotonic() > job.deadline:
+                job.future.set_exception(ResearchDeadlineExceeded("Research deadline exceeded while queued."))
+                continue
+
+            self._running[lane] += 1
+            started = time.monotonic()
+            try:
+                await self._run_job(job)
+            finally:
+                self._running[lane] -= 1
+                self._avg_job_seconds = 0.9 * self._avg_job_seconds + 0.1 * (time.monotonic() - started)
+                # A freed slot may unblock a lane that was held back by the reservation.
+                self._wakeup.set()
+
+    async def _run_job(self, job: _Job) -> None:
+        try:
+            result = await job.run()
+        except Exception as exc:
+            if not job.future.done():
+                job.future.set_exception(exc)
+        except BaseException as exc:
+            if not job.future.done():
+                if isinstance(exc, asyncio.CancelledError):
+                    job.future.cancel()
+                else:
+                    job.future.set_exception(exc)
+            current = asyncio.current_task()
+            worker_cancelled = current is not None and getattr(current, "cancelling", lambda: 0)()
+            if worker_cancelled or isinstance(exc, (KeyboardInterrupt, SystemExit)):
+                raise
+            # The job itself was cancelled or raised a BaseException; keep this worker alive.
+            logger.warning("Research job %s aborted: %r", job.label, exc)
+        else:
+            if not job.future.done():
+                job.future.set_result(result)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "reserved_interactive": self.reserved_interactive,
+            "avg_job_seconds": round(self._avg_job_seconds, 2),
+            "lanes": {
+                lane: {
+                    "weight": self.weights[lane],
+                    "queued": len(jobs),
+                    "max_queued": self.max_queued[lane],
+                    "running": self._running[lane],
+                }
+                for lane, jobs in self._lanes.items()
+            },
+        }
+
+
+research_scheduler = ResearchScheduler()
+
+
+def resolve_deadline(lane: str, deadline_seconds: float | None) -> float | None:
+    if deadline_seconds is None:
+        deadline_seconds = LANE_DEFAULT_DEADLINE_SECONDS.get(lane)
+    if deadline_seconds is None:
+        return None
+    return time.monotonic() + deadline_seconds
+
+
+def log_job_failure(future: asyncio.Future) -> None:
+    """Done-callback for fire-and-forget submissions."""
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.warning("Background research job failed: %s", exc)
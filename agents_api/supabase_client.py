@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import requests
 
@@ -58,10 +58,128 @@ def insert_row(table: str, data: Dict[str, Any]) -> Dict[str, Any]:
     return {}
 
 
-def get_single_row(table: str, *, filters: Dict[str, str]) -> Optional[Dict[str, Any]]:
+def insert_rows(table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    if not rows:
+        return []
+    url = _table_url(table)
+    headers = _base_headers()
+    headers["Prefer"] = "return=representation"
+    resp = requests.post(url, headers=headers, json=rows, timeout=30)
+    try:
+        resp.raise_for_status()
+    except Exception:
+        logger.exception("Failed to bulk insert %d rows into %s: %s", len(rows), table, resp.text)
+        raise
+    try:
+        payload = resp.json()
+    except json.JSONDecodeError:
+        return []
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict):
+        return [payload]
+    return []
+
+
+def _quote(value: Any) -> str:
+    # PostgREST reserved characters (, . : ( ) are safe inside double quotes.
+    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def in_filter(values: Iterable[Any]) -> str:
+    return "in.(" + ",".join(_quote(v) for v in values) + ")"
+
+
+def keyset_params(
+    sort_column: str,
+    after: Optional[Tuple[Any, Any]],
+    *,
+    descending: bool = False,
+) -> Dict[str, str]:
+    """
+    Order + cursor params for keyset pagination on `(sort_column, id)`.
+
+    `after` is the `(sort_value, id)` of the last row of the previous page.
+    """
+    direction, op = ("desc", "lt") if descending else ("asc", "gt")
+    params = {"order": f"{sort_column}.{direction},id.{direction}"}
+    if after is not None:
+        value, row_id = _quote(after[0]), _quote(after[1])
+        params["or"] = f"({sort_column}.{op}.{value},and({sort_column}.eq.{value},id.{op}.{row_id}))"
+    return params
+
+
+def get_rows(
+    table: str,
+    *,
+    filters: Optional[Dict[str, str]] = None,
+    in_filters: Optional[Dict[str, Iterable[Any]]] = None,
+    columns: str = "*",
+    params: Optional[Dict[str, str]] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch rows in one request.
+
+    `filters` are equality filters, `in_filters` become `col=in.(...)`,
+    `columns` is the `select=` projection and `params` is passed through
+    as raw PostgREST params (e.g. from `keyset_params`).
+    """
+    url = _table_url(table)
+    headers = _base_headers()
+    query: Dict[str, str] = {"select": columns}
+    query.update({k: f"eq.{v}" for k, v in (filters or {}).items()})
+    query.update({k: in_filter(v) for k, v in (in_filters or {}).items()})
+    query.update(params or {})
+    if limit is not None:
+        query["limit"] = str(limit)
+    resp = requests.get(url, headers=headers, params=query, timeout=10)
+    try:
+        resp.raise_for_status()
+    except Exception:
+        logger.exception("Failed to fetch from %s: %s", table, resp.text)
+        raise
+    data = resp.json()
+    return data if isinstance(data, list) else []
+
+
+def get_rows_page(
+    table: str,
+    *,
+    columns: str = "*",
+    filters: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, str]] = None,
+    sort_column: str = "created_at",
+    after: Optional[Tuple[Any, Any]] = None,
+    descending: bool = False,
+    limit: int = 100,
+) -> Tuple[List[Dict[str, Any]], Optional[Tuple[Any, Any]]]:
+    """
+    One keyset page ordered by `(sort_column, id)`.
+
+    Returns the rows and the cursor for the next page (None on the last page).
+    `columns` must include `sort_column` and `id`.
+    """
+    query = dict(params or {})
+    query.update(keyset_params(sort_column, after, descending=descending))
+    rows = get_rows(table, filters=filters, columns=columns, params=query, limit=limit)
+    if len(rows) < limit:
+        return rows, None
+    last = rows[-1]
+    return rows, (last[sort_column], last["id"])
+
+
+def get_single_row(
+    table: str,
+    *,
+    filters: Dict[str, str],
+    columns: str = "*",
+) -> Optional[Dict[str, Any]]:
     url = _table_url(table)
     headers = _base_headers()
     params = {k: f"eq.{v}" for k, v in filters.items()}
+    params["select"] = columns
     params["limit"] = "1"
     resp = requests.get(url, headers=headers, params=params, timeout=10)
     try:
@@ -75,6 +193,24 @@ def get_single_row(table: str, *, filters: Dict[str, str]) -> Optional[Dict[str,
     return None
 
 
+def call_rpc(function: str, params: Dict[str, Any]) -> Any:
+    ensure_supabase_config()
+    url = SUPABASE_URL.rstrip("/") + f"/rest/v1/rpc/{function}"
+    headers = _base_headers()
+    resp = requests.post(url, headers=headers, json=params, timeout=10)
+    try:
+        resp.raise_for_status()
+    except Exception:
+        logger.exception("Failed to call rpc %s: %s", function, resp.text)
+        raise
+    if not resp.content:
+        return None
+    try:
+        return resp.json()
+    except json.JSONDecodeError:
+        return None
+
+
 def log_activity(pql_id: Optional[str], action: str, details: Optional[Dict[str, Any]] = None) -> None:
     payload: Dict[str, Any] = {
         "action": action,
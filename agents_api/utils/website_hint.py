@@ -1,5 +1,11 @@
+import asyncio
 import re
-from typing import Any, Dict
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+import requests
 
 
 PERSONAL_EMAIL_DOMAINS = {
@@ -39,20 +45,227 @@ def _extract_email_domain(email: str | None) -> str:
     return domain
 
 
-def infer_website_hint(email: str | None, company_name: str | None) -> Dict[str, Any]:
+HINT_TLDS = ("com", "io", "ai", "co")
+DNS_TIMEOUT_SECONDS = 2.0
+HEAD_TIMEOUT_SECONDS = 3
+POSITIVE_CACHE_TTL_SECONDS = 24 * 60 * 60
+NEGATIVE_CACHE_TTL_SECONDS = 60 * 60
+MAX_HOST_CACHE_ENTRIES = 10_000
+PROBE_MAX_WORKERS = 8
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/122.0.0.0 Safari/537.36"
+)
+
+# host -> (is_live, expires_at). Negative results are cached too so dead guesses
+# are not re-probed for every lead from the same company.
+_host_cache: Dict[str, Tuple[bool, float]] = {}
+
+# Probes (blocking getaddrinfo + HEAD) get their own small pool so they never
+# queue ahead of Supabase, Google search or crawl work in the default executor.
+_probe_executor = ThreadPoolExecutor(max_workers=PROBE_MAX_WORKERS, thread_name_prefix="website-hint-probe")
+
+# host -> [probe task, waiter count]. Leads probing the same host share one probe.
+_inflight_probes: Dict[str, List[Any]] = {}
+
+
+def website_hint_candidates(email: str | None, company_name: str | None) -> List[Dict[str, str]]:
     """
-    Infer a likely homepage URL without performing any web requests.
+    Candidate homepage hosts in priority order.
 
-    Priority:
-    1) Business email domain
-    2) Normalized company name + .com
+    Business email domain first, then the normalized company name with common TLDs.
+    Each host is followed by its `www.` variant.
     """
+    candidates: List[Dict[str, str]] = []
+    seen: set[str] = set()
+
+    def _add(host: str, source: str) -> None:
+        for variant in (host, f"www.{host}"):
+            if variant in seen:
+                continue
+            seen.add(variant)
+            candidates.append({"host": variant, "source": source})
+
     domain = _extract_email_domain(email)
     if domain and domain not in PERSONAL_EMAIL_DOMAINS:
-        return {"url": f"https://{domain}", "source": "email_domain"}
+        _add(domain, "email_domain")
 
     normalized_company = _normalize_company_name(company_name)
     if normalized_company:
-        return {"url": f"https://{normalized_company}.com", "source": "company_name_com"}
+        for tld in HINT_TLDS:
+            _add(f"{normalized_company}.{tld}", f"company_name_{tld}")
+
+    return candidates
+
+
+def _cached_host_status(host: str) -> bool | None:
+    entry = _host_cache.get(host)
+    if entry is None:
+        return None
+    is_live, expires_at = entry
+    if expires_at < time.monotonic():
+        _host_cache.pop(host, None)
+        return None
+    return is_live
+
+
+def _remember_host_status(host: str, is_live: bool) -> None:
+    ttl = POSITIVE_CACHE_TTL_SECONDS if is_live else NEGATIVE_CACHE_TTL_SECONDS
+    _host_cache.pop(host, None)
+    _host_cache[host] = (is_live, time.monotonic() + ttl)
+    if len(_host_cache) <= MAX_HOST_CACHE_ENTRIES:
+        return
+
+    now = time.monotonic()
+    for expired in [h for h, (_, expires_at) in _host_cache.items() if expires_at < now]:
+        del _host_cache[expired]
+    # Still full: drop the oldest entries (dicts keep insertion order).
+    while len(_host_cache) > MAX_HOST_CACHE_ENTRIES:
+        del _host_cache[next(iter(_host_cache))]
+
+
+def _head_is_live(url: str) -> bool:
+    try:
+        response = requests.head(
+            url,
+            timeout=HEAD_TIMEOUT_SECONDS,
+            headers={"User-Agent": USER_AGENT},
+            allow_redirects=True,
+        )
+    except requests.RequestException:
+        return False
+    # 4xx (e.g. 403 bot walls, 405 HEAD not allowed) still means a real site answered.
+    return response.status_code < 500
+
+
+def _set_started(started: asyncio.Future) -> None:
+    if not started.done():
+        started.set_result(None)
+
+
+async def _resolve_host(host: str) -> bool | None:
+    """
+    Resolve `host` on the probe pool. Returns None if the lookup timed out or
+    failed for a reason other than the name not existing.
+
+    DNS_TIMEOUT_SECONDS is counted from when a probe thread picks the lookup
+    up, not from submission, so a pool busy with HEAD requests cannot turn a
+    live host into a timeout.
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.create_future()
+
+    def _lookup() -> None:
+        loop.call_soon_threadsafe(_set_started, started)
+        socket.getaddrinfo(host, 443)
+
+    lookup = loop.run_in_executor(_probe_executor, _lookup)
+    # An abandoned lookup may still fail later; retrieve it so nothing is logged as unhandled.
+    lookup.add_done_callback(lambda f: f.cancelled() or f.exception())
+    try:
+        await started
+        await asyncio.wait_for(asyncio.shield(lookup), timeout=DNS_TIMEOUT_SECONDS)
+    except socket.gaierror:
+        return False
+    except (OSError, asyncio.TimeoutError):
+        return None
+    finally:
+        # Drops the lookup from the pool queue if it has not started yet.
+        lookup.cancel()
+    return True
+
+
+async def _probe_host(host: str) -> bool:
+    loop = asyncio.get_running_loop()
+    resolved = await _resolve_host(host)
+    if resolved is None:
+        # A slow resolver says nothing about the host; don't cache it as dead.
+        return False
+    if not resolved:
+        _remember_host_status(host, False)
+        return False
+
+    is_live = await loop.run_in_executor(_probe_executor, _head_is_live, f"https://{host}")
+    _remember_host_status(host, is_live)
+    return is_live
+
+
+def _is_cancelling(task: asyncio.Task) -> bool:
+    return task.done() or bool(getattr(task, "cancelling", lambda: 0)())
+
+
+def _forget_probe(host: str, entry: List[Any]) -> None:
+    if _inflight_probes.get(host) is entry:
+        del _inflight_probes[host]
+
+
+def _acquire_probe(host: str) -> asyncio.Task:
+    entry = _inflight_probes.get(host)
+    if entry is None or _is_cancelling(entry[0]):
+        task = asyncio.create_task(_probe_host(host))
+        entry = [task, 0]
+        _inflight_probes[host] = entry
+        task.add_done_callback(lambda _, entry=entry: _forget_probe(host, entry))
+    entry[1] += 1
+    return entry[0]
+
+
+def _release_probe(host: str, task: asyncio.Task) -> None:
+    entry = _inflight_probes.get(host)
+    if entry is None or entry[0] is not task:
+        return
+    entry[1] -= 1
+    # Nobody needs this answer any more; cancelling also drops it from the
+    # executor queue if it has not started yet. Forget it right away so a lead
+    # arriving before the cancellation lands starts a fresh probe.
+    if entry[1] <= 0 and not task.done():
+        del _inflight_probes[host]
+        task.cancel()
+
+
+async def _host_is_live(host: str) -> bool:
+    while True:
+        cached = _cached_host_status(host)
+        if cached is not None:
+            return cached
+        task = _acquire_probe(host)
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if not task.cancelled() or (current is not None and _is_cancelling(current)):
+                raise
+            # Another lead abandoned the shared probe; this caller still wants an answer.
+        finally:
+            _release_probe(host, task)
+
+
+async def verify_website_hint_async(email: str | None, company_name: str | None) -> Dict[str, Any]:
+    """
+    Resolve a verified homepage URL for a lead.
+
+    All candidates are probed concurrently (DNS, then a HEAD request) on a
+    dedicated bounded pool, sharing in-flight probes with other leads. The
+    highest-priority live candidate wins; probes no other lead is waiting on
+    are then cancelled. Returns `{"url": None, ...}` if nothing answers.
+    """
+    candidates = website_hint_candidates(email, company_name)
+    if not candidates:
+        return {"url": None, "source": "none", "verified": False, "candidates_checked": 0}
+
+    tasks = [asyncio.create_task(_host_is_live(c["host"])) for c in candidates]
+    try:
+        for candidate, task in zip(candidates, tasks):
+            if await task:
+                return {
+                    "url": f"https://{candidate['host']}",
+                    "source": candidate["source"],
+                    "verified": True,
+                    "candidates_checked": len(candidates),
+                }
+    finally:
+        for task in tasks:
+            task.cancel()
 
-    return {"url": None, "source": "none"}
+    return {"url": None, "source": "none", "verified": False, "candidates_checked": len(candidates)}
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import re
+import time
 from typing import Any, Dict, List
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
 
 import requests
 
+from .circuit_breaker import HostCircuitBreaker
 from .config import GOOGLE_SEARCH_API_KEY, GOOGLE_SEARCH_CX
 
 try:
@@ -26,6 +28,29 @@ USER_AGENT = (
 REQUEST_TIMEOUT_SECONDS = 8
 PLAYWRIGHT_TIMEOUT_MS = 10_000
 MAX_TEXT_CHARS = 700
+# Full page text kept for evidence selection (see evidence.py) when include_text is set.
+MAX_PAGE_TEXT_CHARS = 20_000
+GOOGLE_SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
+GOOGLE_SEARCH_HOST = "www.googleapis.com"
+
+# Optional multi-page crawl: high-value internal pages, matched on URL path, in priority order.
+# Keywords match whole words inside a path segment, so "about" also finds /about-us.
+CRAWL_PAGE_KEYWORDS: Dict[str, tuple[str, ...]] = {
+    "about": ("about", "company", "who-we-are", "team"),
+    "pricing": ("pricing", "plans"),
+    "customers": ("customers", "customer", "case-studies", "case-study", "clients"),
+    "careers": ("careers", "jobs"),
+}
+MAX_CRAWL_PAGES = 4
+CRAWL_CONCURRENCY_PER_DOMAIN = 2
+CRAWL_TIME_BUDGET_SECONDS = 12.0
+CRAWL_BYTE_BUDGET = 2_000_000
+
+# host -> [semaphore, crawls using it]; entries are dropped once no crawl holds them.
+_crawl_semaphores: Dict[str, List[Any]] = {}
+
+# Shared across all leads so a dead host fails fast for the rest of a batch.
+_circuit_breaker = HostCircuitBreaker(failure_threshold=3, window_seconds=60.0, cooldown_seconds=30.0)
 
 
 def _clean_text(value: str | None) -> str:
@@ -56,6 +81,88 @@ def _normalize_url(url: str | None) -> str | None:
     return f"{parsed.scheme}://{parsed.netloc}{parsed.path or ''}"
 
 
+def _host_of(url: str) -> str:
+    return (urlparse(url).netloc or "").lower()
+
+
+def _circuit_open_page_result(url: str, host: str, renderer: str) -> Dict[str, Any]:
+    return {
+        "url": url,
+        "ok": False,
+        "error": "circuit_open",
+        "circuit": _circuit_breaker.state(host),
+        "renderer": renderer,
+    }
+
+
+def _is_host_failure(exc: requests.RequestException) -> bool:
+    # A 4xx means the host answered; only network errors and 5xx count against it.
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return exc.response.status_code >= 500
+    return True
+
+
+def circuit_breaker_snapshot() -> Dict[str, Dict[str, Any]]:
+    """Current per-host circuit breaker state for web navigation."""
+    return _circuit_breaker.snapshot()
+
+
+def _same_site(host_a: str, host_b: str) -> bool:
+    return host_a.removeprefix("www.") == host_b.removeprefix("www.")
+
+
+def _extract_internal_links(html_content: str, base_url: str) -> List[str]:
+    base_host = _host_of(base_url)
+    links: List[str] = []
+    seen: set[str] = set()
+    for href in re.findall(r'<a[^>]+href=["\']([^"\'#]+)', html_content, flags=re.IGNORECASE):
+        absolute = urljoin(base_url, href.strip())
+        parsed = urlparse(absolute)
+        if parsed.scheme not in ("http", "https") or not _same_site(parsed.netloc.lower(), base_host):
+            continue
+        normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path.rstrip('/') or '/'}"
+        if normalized in seen:
+            continue
+        seen.add(normalized)
+        links.append(normalized)
+    return links
+
+
+def _segment_words(segment: str) -> str:
+    # Padded so a keyword only matches whole words: " about us " contains " about ".
+    return f" {' '.join(re.split(r'[-_.]+', segment))} "
+
+
+def _select_crawl_targets(links: List[str], homepage_url: str) -> List[Dict[str, str]]:
+    """Pick at most one link per page type, trying keywords in CRAWL_PAGE_KEYWORDS order."""
+    homepage = homepage_url.rstrip("/")
+    candidates: List[tuple[str, List[str]]] = []
+    for link in links:
+        if link.rstrip("/") == homepage:
+            continue
+        segments = [seg for seg in urlparse(link).path.lower().split("/") if seg]
+        # Prefer shallow pages like /about or /company/about over deep blog posts.
+        if 0 < len(segments) <= 2:
+            candidates.append((link, [_segment_words(seg) for seg in segments]))
+
+    targets: List[Dict[str, str]] = []
+    for page_type, keywords in CRAWL_PAGE_KEYWORDS.items():
+        match = next(
+            (
+                link
+                for keyword in keywords
+                for link, segments in candidates
+                if any(_segment_words(keyword) in seg for seg in segments)
+            ),
+            None,
+        )
+        if match is not None:
+            targets.append({"url": match, "page_type": page_type})
+        if len(targets) >= MAX_CRAWL_PAGES:
+            break
+    return targets
+
+
 def _extract_title(html_content: str) -> str:
     match = re.search(r"<title[^>]*>(.*?)</title>", html_content, flags=re.IGNORECASE | re.DOTALL)
     return _clean_text(match.group(1)) if match else ""
@@ -70,18 +177,30 @@ def _extract_meta_description(html_content: str) -> str:
     return _clean_text(match.group(1)) if match else ""
 
 
-def _extract_visible_excerpt(html_content: str) -> str:
+def _extract_visible_text(html_content: str) -> str:
     no_script = re.sub(
-        r"<script[\\s\\S]*?</script>|<style[\\s\\S]*?</style>",
+        r"<script[\s\S]*?</script>|<style[\s\S]*?</style>",
         " ",
         html_content,
         flags=re.IGNORECASE,
     )
     text = re.sub(r"<[^>]+>", " ", no_script)
-    return _truncate(_clean_text(text))
+    return _clean_text(text)
+
+
+def _extract_visible_excerpt(html_content: str) -> str:
+    return _truncate(_extract_visible_text(html_content))
+
 
+def _fetch_page_summary_requests(
+    url: str,
+    collect_links: bool = False,
+    include_text: bool = False,
+) -> Dict[str, Any]:
+    host = _host_of(url)
+    if not _circuit_breaker.allow(host):
+        return _circuit_open_page_result(url, host, "requests")
 
-def _fetch_page_summary_requests(url: str) -> Dict[str, Any]:
     try:
         response = requests.get(
             url,
@@ -91,6 +210,10 @@ def _fetch_page_summary_requests(url: str) -> Dict[str, Any]:
         )
         response.raise_for_status()
     except requests.RequestException as exc:
+        if _is_host_failure(exc):
+            _circuit_breaker.record_failure(host, str(exc))
+        else:
+            _circuit_breaker.record_success(host)
         return {
             "url": url,
             "ok": False,
@@ -98,6 +221,8 @@ def _fetch_page_summary_requests(url: str) -> Dict[str, Any]:
             "renderer": "requests",
         }
 
+    _circuit_breaker.record_success(host)
+
     content_type = (response.headers.get("Content-Type") or "").lower()
     if "text/html" not in content_type:
         return {
@@ -111,7 +236,7 @@ def _fetch_page_summary_requests(url: str) -> Dict[str, Any]:
         }
 
     html_content = response.text or ""
-    return {
+    summary = {
         "url": response.url,
         "ok": True,
         "title": _extract_title(html_content),
@@ -120,9 +245,18 @@ def _fetch_page_summary_requests(url: str) -> Dict[str, Any]:
         "content_type": content_type,
         "renderer": "requests",
     }
-
-
-async def _fetch_page_summary_playwright(url: str) -> Dict[str, Any]:
+    if collect_links:
+        summary["internal_links"] = _extract_internal_links(html_content, response.url)
+    if include_text:
+        summary["text"] = _extract_visible_text(html_content)[:MAX_PAGE_TEXT_CHARS]
+    return summary
+
+
+async def _fetch_page_summary_playwright(
+    url: str,
+    collect_links: bool = False,
+    include_text: bool = False,
+) -> Dict[str, Any]:
     if async_playwright is None:
         return {
             "url": url,
@@ -131,6 +265,11 @@ async def _fetch_page_summary_playwright(url: str) -> Dict[str, Any]:
             "renderer": "playwright",
         }
 
+    host = _host_of(url)
+    if not _circuit_breaker.allow(host):
+        return _circuit_open_page_result(url, host, "playwright")
+
+    outcome_recorded = False
     try:
         async with async_playwright() as pw:
             browser = await pw.chromium.launch(headless=True)
@@ -138,6 +277,18 @@ async def _fetch_page_summary_playwright(url: str) -> Dict[str, Any]:
             page = await context.new_page()
 
             response = await page.goto(url, wait_until="domcontentloaded", timeout=PLAYWRIGHT_TIMEOUT_MS)
+            # goto() does not raise on HTTP errors; count 5xx against the host like the requests path does.
+            if response is not None and response.status >= 500:
+                _circuit_breaker.record_failure(host, f"HTTP {response.status}")
+                outcome_recorded = True
+                await context.close()
+                await browser.close()
+                return {
+                    "url": url,
+                    "ok": False,
+                    "error": f"HTTP {response.status}",
+                    "renderer": "playwright",
+                }
             await page.wait_for_timeout(400)
 
             content_type = ""
@@ -169,7 +320,9 @@ async def _fetch_page_summary_playwright(url: str) -> Dict[str, Any]:
             await context.close()
             await browser.close()
 
-            return {
+            _circuit_breaker.record_success(host)
+            outcome_recorded = True
+            summary = {
                 "url": final_url,
                 "ok": True,
                 "title": title,
@@ -178,27 +331,193 @@ async def _fetch_page_summary_playwright(url: str) -> Dict[str, Any]:
                 "content_type": content_type,
                 "renderer": "playwright",
             }
+            if collect_links:
+                summary["internal_links"] = _extract_internal_links(html_content, final_url)
+            if include_text:
+                text = _clean_text(body_text) if body_text else _extract_visible_text(html_content)
+                summary["text"] = text[:MAX_PAGE_TEXT_CHARS]
+            return summary
     except (PlaywrightTimeoutError, PlaywrightError) as exc:
+        _circuit_breaker.record_failure(host, str(exc))
+        outcome_recorded = True
         return {
             "url": url,
             "ok": False,
             "error": str(exc),
             "renderer": "playwright",
         }
-
-
-async def _fetch_page_summary_async(url: str) -> Dict[str, Any]:
-    playwright_result = await _fetch_page_summary_playwright(url)
-    if playwright_result.get("ok"):
+    finally:
+        # Cancelled or failed with something unexpected: don't leave a half-open probe stuck.
+        if not outcome_recorded:
+            _circuit_breaker.release_probe(host)
+
+
+async def _fetch_page_summary_async(
+    url: str,
+    collect_links: bool = False,
+    include_text: bool = False,
+) -> Dict[str, Any]:
+    playwright_result = await _fetch_page_summary_playwright(
+        url, collect_links=collect_links, include_text=include_text
+    )
+    if playwright_result.get("ok") or playwright_result.get("error") == "circuit_open":
         return playwright_result
 
-    fallback = await asyncio.to_thread(_fetch_page_summary_requests, url)
+    fallback = await asyncio.to_thread(_fetch_page_summary_requests, url, collect_links, include_text)
     fallback["playwright_error"] = playwright_result.get("error")
     if fallback.get("renderer") == "requests":
         fallback["renderer"] = "requests_fallback"
     return fallback
 
 
+def _fetch_crawl_page(
+    session: requests.Session,
+    url: str,
+    page_type: str,
+    max_bytes: int,
+    include_text: bool = False,
+) -> Dict[str, Any]:
+    host = _host_of(url)
+    if not _circuit_breaker.allow(host):
+        result = _circuit_open_page_result(url, host, "requests_crawl")
+        result["page_type"] = page_type
+        return result
+
+    try:
+        with session.get(url, timeout=REQUEST_TIMEOUT_SECONDS, stream=True, allow_redirects=True) as response:
+            response.raise_for_status()
+            content_type = (response.headers.get("Content-Type") or "").lower()
+            body = b""
+            if "text/html" in content_type:
+                for block in response.iter_content(chunk_size=16_384):
+                    body += block
+                    if len(body) >= max_bytes:
+                        body = body[:max_bytes]
+                        break
+            final_url = response.url
+            encoding = response.encoding or "utf-8"
+    except requests.RequestException as exc:
+        if _is_host_failure(exc):
+            _circuit_breaker.record_failure(host, str(exc))
+        else:
+            _circuit_breaker.record_success(host)
+        return {"url": url, "page_type": page_type, "ok": False, "error": str(exc), "renderer": "requests_crawl"}
+
+    _circuit_breaker.record_success(host)
+    html_content = body.decode(encoding, errors="replace")
+    text = _extract_visible_text(html_content)
+    page = {
+        "url": final_url,
+        "page_type": page_type,
+        "ok": True,
+        "title": _extract_title(html_content),
+        "description": _extract_meta_description(html_content),
+        "excerpt": _truncate(text),
+        "bytes": len(body),
+        "renderer": "requests_crawl",
+    }
+    if include_text:
+        page["text"] = text[:MAX_PAGE_TEXT_CHARS]
+    return page
+
+
+def _acquire_crawl_semaphore(host: str) -> asyncio.Semaphore:
+    entry = _crawl_semaphores.get(host)
+    if entry is None:
+        entry = [asyncio.Semaphore(CRAWL_CONCURRENCY_PER_DOMAIN), 0]
+        _crawl_semaphores[host] = entry
+    entry[1] += 1
+    return entry[0]
+
+
+def _release_crawl_semaphore(host: str) -> None:
+    entry = _crawl_semaphores.get(host)
+    if entry is None:
+        return
+    entry[1] -= 1
+    if entry[1] <= 0:
+        del _crawl_semaphores[host]
+
+
+async def _crawl_internal_pages_async(
+    homepage_url: str,
+    links: List[str],
+    include_text: bool = False,
+) -> Dict[str, Any]:
+    """
+    Fetch high-value internal pages found on the homepage.
+
+    Pages are fetched in parallel over one keep-alive session, at most
+    CRAWL_CONCURRENCY_PER_DOMAIN at a time per host, within a shared time budget.
+    The byte budget is split evenly across the selected pages.
+
+    A fetch that overruns the budget is abandoned, not interrupted: its thread
+    keeps the host slot and the session until it returns.
+    """
+    targets = _select_crawl_targets(links, homepage_url)
+    budget = {
+        "max_pages": MAX_CRAWL_PAGES,
+        "time_budget_seconds": CRAWL_TIME_BUDGET_SECONDS,
+        "byte_budget": CRAWL_BYTE_BUDGET,
+    }
+    if not targets:
+        return {"pages": [], "budget": budget, "elapsed_ms": 0, "bytes": 0}
+
+    host = _host_of(homepage_url)
+    semaphore = _acquire_crawl_semaphore(host)
+    max_bytes_per_page = CRAWL_BYTE_BUDGET // len(targets)
+    started = time.monotonic()
+    loop = asyncio.get_running_loop()
+
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    fetches: List[asyncio.Future] = []
+
+    async def _fetch(target: Dict[str, str]) -> Dict[str, Any]:
+        await semaphore.acquire()
+        fetch = loop.run_in_executor(
+            None,
+            _fetch_crawl_page,
+            session,
+            target["url"],
+            target["page_type"],
+            max_bytes_per_page,
+            include_text,
+        )
+        # Cancelling this task cannot stop the thread, so the slot is released by the thread's future.
+        fetch.add_done_callback(lambda _: semaphore.release())
+        fetches.append(fetch)
+        return await asyncio.shield(fetch)
+
+    def _close_crawl(_: Any = None) -> None:
+        session.close()
+        _release_crawl_semaphore(host)
+
+    tasks = [asyncio.create_task(_fetch(target)) for target in targets]
+    await asyncio.wait(tasks, timeout=CRAWL_TIME_BUDGET_SECONDS)
+    for task in tasks:
+        task.cancel()
+
+    running = [fetch for fetch in fetches if not fetch.done()]
+    if running:
+        asyncio.gather(*running, return_exceptions=True).add_done_callback(_close_crawl)
+    else:
+        _close_crawl()
+
+    pages: List[Dict[str, Any]] = []
+    for target, task in zip(targets, tasks):
+        if task.done() and not task.cancelled():
+            pages.append(task.result())
+        else:
+            pages.append({**target, "ok": False, "error": "crawl_time_budget_exceeded", "renderer": "requests_crawl"})
+
+    return {
+        "pages": pages,
+        "budget": budget,
+        "elapsed_ms": round((time.monotonic() - started) * 1000),
+        "bytes": sum(page.get("bytes", 0) for page in pages),
+    }
+
 
 def _extract_google_api_error(payload: Dict[str, Any], http_status: int) -> Dict[str, Any]:
     error_obj = payload.get("error") if isinstance(payload, dict) else None
@@ -250,9 +569,23 @@ def _search_subject_google_api(subject: str, limit: int = 5) -> Dict[str, Any]:
             },
         }
 
+    if not _circuit_breaker.allow(GOOGLE_SEARCH_HOST):
+        return {
+            "query": query,
+            "engine": "google",
+            "results": [],
+            "error": "circuit_open",
+            "google_error": {
+                "http_status": 503,
+                "message": "Google Custom Search API is failing; skipping request until the circuit half-opens.",
+                "reasons": ["circuit_open"],
+            },
+            "circuit": _circuit_breaker.state(GOOGLE_SEARCH_HOST),
+        }
+
     try:
         response = requests.get(
-            "https://www.googleapis.com/customsearch/v1",
+            GOOGLE_SEARCH_URL,
             params={
                 "key": GOOGLE_SEARCH_API_KEY,
                 "cx": GOOGLE_SEARCH_CX,
@@ -262,7 +595,8 @@ def _search_subject_google_api(subject: str, limit: int = 5) -> Dict[str, Any]:
             timeout=REQUEST_TIMEOUT_SECONDS,
             headers={"User-Agent": USER_AGENT},
         )
-    except requests.RequestException:
+    except requests.RequestException as exc:
+        _circuit_breaker.record_failure(GOOGLE_SEARCH_HOST, str(exc))
         return {
             "query": query,
             "engine": "google",
@@ -280,6 +614,12 @@ def _search_subject_google_api(subject: str, limit: int = 5) -> Dict[str, Any]:
     except ValueError:
         payload = {}
 
+    # Quota (429) and server errors mean the API is unhealthy; other 4xx are request/config problems.
+    if response.status_code == 429 or response.status_code >= 500:
+        _circuit_breaker.record_failure(GOOGLE_SEARCH_HOST, f"HTTP {response.status_code}")
+    else:
+        _circuit_breaker.record_success(GOOGLE_SEARCH_HOST)
+
     if response.status_code >= 400:
         google_error = _extract_google_api_error(payload, response.status_code)
         return {
@@ -320,10 +660,17 @@ async def _search_subject_async(subject: str, limit: int = 5) -> Dict[str, Any]:
     return await asyncio.to_thread(_search_subject_google_api, subject, limit)
 
 
-def _build_sources(website: Dict[str, Any] | None, search: Dict[str, Any]) -> List[str]:
+def _build_sources(
+    website: Dict[str, Any] | None,
+    search: Dict[str, Any],
+    pages: List[Dict[str, Any]] | None = None,
+) -> List[str]:
     sources: List[str] = []
     if website and website.get("url"):
         sources.append(str(website["url"]))
+    for page in pages or []:
+        if page.get("ok") and page.get("url"):
+            sources.append(str(page["url"]))
     for row in search.get("results", []):
         if row.get("url"):
             sources.append(row["url"])
@@ -356,17 +703,50 @@ def gather_subject_context(subject: str, website_hint_url: str | None = None) ->
     }
 
 
-async def gather_subject_context_async(subject: str, website_hint_url: str | None = None) -> Dict[str, Any]:
+async def gather_subject_context_async(
+    subject: str,
+    website_hint_url: str | None = None,
+    crawl: bool = False,
+    include_text: bool = False,
+) -> Dict[str, Any]:
+    """
+    Async web navigation context for a subject.
+
+    With `crawl=True`, internal pages linked from the homepage (about, pricing,
+    customers, careers) are also fetched and returned under `pages`.
+    With `include_text=True`, fetched pages also carry their full visible
+    `text` (capped at MAX_PAGE_TEXT_CHARS) for evidence selection.
+    """
     normalized_url = _normalize_url(website_hint_url)
-    website = await _fetch_page_summary_async(normalized_url) if normalized_url else None
+    website = None
+    if normalized_url:
+        website = await _fetch_page_summary_async(normalized_url, collect_links=crawl, include_text=include_text)
+
+    crawl_task = None
+    if website is not None:
+        internal_links = website.pop("internal_links", None)
+        if website.get("ok") and internal_links:
+            crawl_task = asyncio.create_task(
+                _crawl_internal_pages_async(str(website["url"]), internal_links, include_text=include_text)
+            )
+
+    # Search runs while the crawl is in flight.
     search = await _search_subject_async(subject, limit=5)
 
-    return {
+    context: Dict[str, Any] = {
         "subject": _clean_text(subject),
         "website": website,
         "search": search,
-        "sources": _build_sources(website, search),
     }
+    pages: List[Dict[str, Any]] = []
+    if crawl:
+        crawl_result = await crawl_task if crawl_task else {"pages": [], "elapsed_ms": 0, "bytes": 0}
+        pages = crawl_result["pages"]
+        context["pages"] = pages
+        context["crawl"] = {key: value for key, value in crawl_result.items() if key != "pages"}
+
+    context["sources"] = _build_sources(website, search, pages)
+    return context
 
 
 async def google_search_top_links_async(query: str, limit: int = 5) -> Dict[str, Any]:
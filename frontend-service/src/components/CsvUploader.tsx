@@ -1,4 +1,5 @@
 import { useState, useCallback } from 'react';
+import { useQueryClient } from '@tanstack/react-query';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
 import { Input } from '@/components/ui/input';
@@ -18,10 +19,22 @@ interface ParsedRow {
   [key: string]: string;
 }
 
+interface ImportReport {
+  total_rows: number;
+  inserted: number;
+  failed: number;
+  research_enqueued: number;
+  chunks: { index: number; rows: number; inserted: number; error?: string }[];
+}
+
+const PREVIEW_BYTES = 256 * 1024;
+const PREVIEW_ROWS = 50;
+
 export function CsvUploader() {
   const [rows, setRows] = useState<ParsedRow[]>([]);
   const [headers, setHeaders] = useState<string[]>([]);
   const [fileName, setFileName] = useState('');
+  const [file, setFile] = useState<File | null>(null);
   const [processing, setProcessing] = useState(false);
   const [singleId, setSingleId] = useState('');
   const [singleEmail, setSingleEmail] = useState('');
@@ -31,9 +44,13 @@ export function CsvUploader() {
     getStoredQualificationThreshold(),
   );
   const insertPqls = useInsertPqls();
+  const qc = useQueryClient();
 
   const handleFile = useCallback((file: File) => {
     setFileName(file.name);
+    setFile(file);
+    // Only the head of the file is parsed for the preview; the full file is
+    // streamed to the agents API on import.
     const reader = new FileReader();
     reader.onload = (e) => {
       const text = e.target?.result as string;
@@ -41,7 +58,9 @@ export function CsvUploader() {
       if (lines.length < 2) return;
       const hdrs = lines[0].split(',').map((h) => h.trim().replace(/^"|"$/g, ''));
       setHeaders(hdrs);
-      const parsed = lines.slice(1).map((line) => {
+      // The last line may be cut off by the slice, so drop it when the file is larger.
+      const bodyLines = file.size > PREVIEW_BYTES ? lines.slice(1, -1) : lines.slice(1);
+      const parsed = bodyLines.slice(0, PREVIEW_ROWS).map((line) => {
         const vals = line.split(',').map((v) => v.trim().replace(/^"|"$/g, ''));
         const row: ParsedRow = {};
         hdrs.forEach((h, i) => { row[h] = vals[i] ?? ''; });
@@ -49,7 +68,7 @@ export function CsvUploader() {
       });
       setRows(parsed);
     };
-    reader.readAsText(file);
+    reader.readAsText(file.slice(0, PREVIEW_BYTES));
   }, []);
 
   const onDrop = useCallback((e: React.DragEvent) => {
@@ -78,13 +97,22 @@ export function CsvUploader() {
     try {
       let processed = 0;
       for (const pql of inserted) {
-        const response = await fetch(`${AGENTS_API_BASE_URL}/research?pql_id=${pql.id}`, {
+        const response = await fetch(`${AGENTS_API_BASE_URL}/research?pql_id=${pql.id}&priority=interactive`, {
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
           body: JSON.stringify({
             qualification_threshold: qualificationThreshold,
           }),
         });
+        if (response.status === 429) {
+          const retryAfter = response.headers.get('Retry-After');
+          toast({
+            title: 'Agents API busy',
+            description: `PQL saved; research queue is full. Retry in ${retryAfter ?? 'a few'} seconds.`,
+            variant: 'destructive',
+          });
+          return;
+        }
         if (!response.ok) {
           throw new Error(`Status ${response.status} while enriching ${pql.id}`);
         }
@@ -107,54 +135,45 @@ export function CsvUploader() {
   };
 
   const handleImportAndProcess = async () => {
-    if (rows.length === 0) return;
+    if (!file) return;
     setProcessing(true);
     try {
-      // Map CSV rows to PQL records
-      const pqlRows = rows.map((row) => {
-        // Normalize usage score across different possible header labels
-        const usageRaw =
-          (row as any).product_usage_score ??
-          (row as any).usage_score ??
-          (row as any).score ??
-          (row as any)['Usage Score (1-10)'] ??
-          (row as any)['Usage Score'] ??
-          null;
-
-        const usageNum =
-          usageRaw !== null && usageRaw !== undefined && usageRaw !== ''
-            ? Number(usageRaw)
-            : null;
-
-        return {
-          email: (row as any).email || (row as any).Email || '',
-          company_name:
-            (row as any).company_name ||
-            (row as any).Company ||
-            (row as any).company ||
-            (row as any)['Company Name'] ||
-            (row as any)['Company name'] ||
-            null,
-          product_usage_score: usageNum,
-          // Only send values that are already in a date-like field.
-          // Free-text values like "2 hours ago" stay in raw_data
-          // (e.g. under the "Last Active" header) and are interpreted
-          // later by the qualification agent.
-          last_active_date:
-            (row as any).last_active_date ??
-            (row as any).last_active ??
-            null,
-          raw_data: row as any,
-          status: 'pending' as const,
-        };
+      // The agents API maps columns, inserts in chunks and starts research per chunk.
+      const response = await fetch(`${AGENTS_API_BASE_URL}/pqls/import`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'text/csv' },
+        body: file,
       });
+      if (!response.ok) {
+        throw new Error(`Status ${response.status} while importing ${file.name}`);
+      }
+      const report: ImportReport = await response.json();
+      qc.invalidateQueries({ queryKey: ['pqls'] });
 
-      const inserted = await insertPqls.mutateAsync(pqlRows);
-      await runAgentsEnrichment(inserted);
+      const failedChunks = report.chunks.filter((c) => c.error);
+      if (failedChunks.length > 0) {
+        toast({
+          title: `${report.inserted} of ${report.total_rows} PQLs imported`,
+          description: `${failedChunks.length} chunk(s) failed: ${failedChunks[0].error}`,
+          variant: 'destructive',
+        });
+      } else {
+        toast({
+          title: `${report.inserted} PQLs imported`,
+          description: `Research started for ${report.research_enqueued} PQLs.`,
+        });
+      }
 
       setRows([]);
       setHeaders([]);
       setFileName('');
+      setFile(null);
+    } catch (e: any) {
+      toast({
+        title: 'Import failed',
+        description: e.message,
+        variant: 'destructive',
+      });
     } finally {
       setProcessing(false);
     }
@@ -296,7 +315,7 @@ export function CsvUploader() {
             <div className="flex items-center justify-between">
               <CardTitle className="text-sm flex items-center gap-2">
                 <FileSpreadsheet className="h-4 w-4" />
-                {fileName} — {rows.length} rows
+                {fileName} — preview
               </CardTitle>
               <Button onClick={handleImportAndProcess} disabled={processing}>
                 {processing ? <Loader2 className="mr-2 h-4 w-4 animate-spin" /> : null}
@@ -313,7 +332,7 @@ export function CsvUploader() {
                   </TableRow>
                 </TableHeader>
                 <TableBody>
-                  {rows.slice(0, 50).map((row, i) => (
+                  {rows.map((row, i) => (
                     <TableRow key={i}>
                       {headers.map((h) => <TableCell key={h}>{row[h]}</TableCell>)}
                     </TableRow>
@@ -321,7 +340,7 @@ export function CsvUploader() {
                 </TableBody>
               </Table>
             </div>
-            {rows.length > 50 && <p className="text-xs text-muted-foreground mt-2">Showing first 50 of {rows.length} rows</p>}
+            {rows.length >= PREVIEW_ROWS && <p className="text-xs text-muted-foreground mt-2">Showing first {PREVIEW_ROWS} rows</p>}
           </CardContent>
         </Card>
       )}
@@ -1,5 +1,5 @@
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
-import { usePqls } from '@/hooks/use-pqls';
+import { usePqlStatusCounts } from '@/hooks/use-pqls';
 import { PQL_STATUSES, type PqlStatus } from '@/lib/constants';
 import { Clock, CheckCircle2, Sparkles, Send, XCircle } from 'lucide-react';
 
@@ -12,10 +12,10 @@ const icons: Record<string, React.ElementType> = {
 };
 
 export function PipelineOverview() {
-  const { data: pqls } = usePqls();
+  const { data: statusCounts } = usePqlStatusCounts();
 
   const counts = Object.keys(PQL_STATUSES).reduce((acc, status) => {
-    acc[status] = pqls?.filter((p) => p.status === status).length ?? 0;
+    acc[status] = statusCounts?.[status] ?? 0;
     return acc;
   }, {} as Record<string, number>);
 
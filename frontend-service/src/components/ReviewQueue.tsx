@@ -1,5 +1,7 @@
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '@/components/ui/table';
+import { Button } from '@/components/ui/button';
 import { usePqls } from '@/hooks/use-pqls';
+import { Loader2 } from 'lucide-react';
 
 interface ReviewQueueProps {
   onSelect: (id: string) => void;
@@ -8,11 +10,9 @@ interface ReviewQueueProps {
 }
 
 export function ReviewQueue({ onSelect, selectedId, statusFilter }: ReviewQueueProps) {
-  const { data: pqls, isLoading } = usePqls();
+  const { data, isLoading, fetchNextPage, hasNextPage, isFetchingNextPage } = usePqls(statusFilter);
 
-  const filtered = statusFilter
-    ? pqls?.filter((p) => p.status === statusFilter)
-    : pqls;
+  const filtered = data?.pages.flatMap((page) => page.items);
 
   if (isLoading) return <div className="p-8 text-center text-muted-foreground">Loading…</div>;
 
@@ -40,51 +40,22 @@ export function ReviewQueue({ onSelect, selectedId, statusFilter }: ReviewQueueP
                 className={`cursor-pointer ${selectedId === pql.id ? 'bg-accent' : ''}`}
                 onClick={() => onSelect(pql.id)}
               >
-                {(() => {
-                  const raw = (pql.raw_data || {}) as Record<string, any>;
-                  const firstName =
-                    raw.first_name ||
-                    raw.firstName ||
-                    raw['First Name'] ||
-                    raw['first name'] ||
-                    '';
-                  const lastName =
-                    raw.last_name ||
-                    raw.lastName ||
-                    raw['Last Name'] ||
-                    raw['last name'] ||
-                    '';
-                  const combinedName = `${String(firstName).trim()} ${String(lastName).trim()}`.trim();
-                  const nameDisplay =
-                    raw.name ||
-                    raw.Name ||
-                    raw.full_name ||
-                    raw.fullName ||
-                    raw['Full Name'] ||
-                    combinedName ||
-                    '—';
-                  const companyDisplay =
-                    pql.company_name ||
-                    raw['Company Name'] ||
-                    raw['Company name'] ||
-                    raw.Company ||
-                    raw.company_name ||
-                    raw.company ||
-                    '—';
-
-                  return (
-                    <>
-                      <TableCell className="font-medium">{String(nameDisplay)}</TableCell>
-                      <TableCell className="font-medium">{companyDisplay}</TableCell>
-                      <TableCell className="text-muted-foreground">{pql.email}</TableCell>
-                    </>
-                  );
-                })()}
+                <TableCell className="font-medium">{pql.display_name || '—'}</TableCell>
+                <TableCell className="font-medium">{pql.company_name || '—'}</TableCell>
+                <TableCell className="text-muted-foreground">{pql.email}</TableCell>
               </TableRow>
             ))
           )}
         </TableBody>
       </Table>
+      {hasNextPage && (
+        <div className="flex justify-center border-t p-3">
+          <Button variant="outline" size="sm" onClick={() => fetchNextPage()} disabled={isFetchingNextPage}>
+            {isFetchingNextPage ? <Loader2 className="mr-2 h-4 w-4 animate-spin" /> : null}
+            {isFetchingNextPage ? 'Loading…' : 'Load more'}
+          </Button>
+        </div>
+      )}
     </div>
   );
 }
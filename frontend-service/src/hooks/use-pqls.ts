@@ -1,22 +1,70 @@
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useQuery, useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { supabase } from '@/integrations/supabase/client';
 import { toast } from '@/hooks/use-toast';
+import { AGENTS_API_BASE_URL, PQL_STATUSES } from '@/lib/constants';
 import type { Tables, TablesInsert } from '@/integrations/supabase/types';
 
 export type Pql = Tables<'pqls'>;
 export type Enrichment = Tables<'enrichments'>;
 export type EmailDraft = Tables<'email_drafts'>;
 
-export function usePqls() {
+// Row shape returned by the agents API `GET /pqls` (no raw_data).
+export interface PqlSummary {
+  id: string;
+  email: string;
+  company_name: string | null;
+  display_name: string | null;
+  product_usage_score: number | null;
+  last_active_date: string | null;
+  status: string;
+  qualification_result: string | null;
+  created_at: string;
+  updated_at: string;
+  enrichment_status: 'researched' | 'pending';
+  enrichment_source: string | null;
+  enriched_at: string | null;
+}
+
+interface PqlSummaryPage {
+  items: PqlSummary[];
+  next_cursor: string | null;
+}
+
+const PQL_PAGE_SIZE = 50;
+
+export function usePqls(status?: string) {
+  return useInfiniteQuery({
+    queryKey: ['pqls', { status: status ?? 'all' }],
+    initialPageParam: null as string | null,
+    queryFn: async ({ pageParam }): Promise<PqlSummaryPage> => {
+      const params = new URLSearchParams({ limit: String(PQL_PAGE_SIZE) });
+      if (pageParam) params.set('cursor', pageParam);
+      if (status) params.set('status', status);
+      // The browser revalidates with If-None-Match; unchanged pages come back as 304.
+      const resp = await fetch(`${AGENTS_API_BASE_URL}/pqls?${params}`);
+      if (!resp.ok) throw new Error(`Status ${resp.status} while loading PQLs`);
+      return resp.json();
+    },
+    getNextPageParam: (lastPage) => lastPage.next_cursor,
+  });
+}
+
+export function usePqlStatusCounts() {
   return useQuery({
-    queryKey: ['pqls'],
+    queryKey: ['pqls', 'counts'],
     queryFn: async () => {
-      const { data, error } = await supabase
-        .from('pqls')
-        .select('*')
-        .order('created_at', { ascending: false });
-      if (error) throw error;
-      return data;
+      // HEAD requests with an exact count: no rows are transferred.
+      const entries = await Promise.all(
+        Object.keys(PQL_STATUSES).map(async (status) => {
+          const { count, error } = await supabase
+            .from('pqls')
+            .select('id', { count: 'exact', head: true })
+            .eq('status', status);
+          if (error) throw error;
+          return [status, count ?? 0] as const;
+        }),
+      );
+      return Object.fromEntries(entries) as Record<string, number>;
     },
   });
 }
@@ -175,7 +175,15 @@ export type Database = {
       [_ in never]: never
     }
     Functions: {
-      [_ in never]: never
+      save_research_results: {
+        Args: {
+          p_activity_details?: Json
+          p_email_draft?: Json
+          p_enrichment: Json
+          p_pql_id: string
+        }
+        Returns: undefined
+      }
     }
     Enums: {
       [_ in never]: never
@@ -0,0 +1,53 @@
+-- Persist one research run (enrichment + optional email draft + activity log) in a single round trip.
+-- Called by the agents API via POST /rest/v1/rpc/save_research_results.
+CREATE OR REPLACE FUNCTION public.save_research_results(
+  p_pql_id UUID,
+  p_enrichment JSONB,
+  p_email_draft JSONB DEFAULT NULL,
+  p_activity_details JSONB DEFAULT '{}'::jsonb
+)
+RETURNS VOID AS $$
+BEGIN
+  UPDATE public.enrichments
+  SET company_info = COALESCE(p_enrichment->'company_info', '{}'::jsonb),
+      key_contacts = COALESCE(p_enrichment->'key_contacts', '[]'::jsonb),
+      enrichment_source = p_enrichment->>'enrichment_source'
+  WHERE pql_id = p_pql_id;
+
+  IF NOT FOUND THEN
+    INSERT INTO public.enrichments (pql_id, company_info, key_contacts, enrichment_source)
+    VALUES (
+      p_pql_id,
+      COALESCE(p_enrichment->'company_info', '{}'::jsonb),
+      COALESCE(p_enrichment->'key_contacts', '[]'::jsonb),
+      p_enrichment->>'enrichment_source'
+    );
+  END IF;
+
+  IF p_email_draft IS NOT NULL THEN
+    -- Never overwrite a draft a reviewer has already edited.
+    UPDATE public.email_drafts
+    SET to_email = p_email_draft->>'to_email',
+        subject = p_email_draft->>'subject',
+        body = p_email_draft->>'body',
+        proposed_offer = p_email_draft->>'proposed_offer',
+        ai_reasoning = p_email_draft->>'ai_reasoning'
+    WHERE pql_id = p_pql_id AND COALESCE(is_edited, false) = false;
+
+    IF NOT FOUND AND NOT EXISTS (SELECT 1 FROM public.email_drafts WHERE pql_id = p_pql_id) THEN
+      INSERT INTO public.email_drafts (pql_id, to_email, subject, body, proposed_offer, ai_reasoning)
+      VALUES (
+        p_pql_id,
+        p_email_draft->>'to_email',
+        p_email_draft->>'subject',
+        p_email_draft->>'body',
+        p_email_draft->>'proposed_offer',
+        p_email_draft->>'ai_reasoning'
+      );
+    END IF;
+  END IF;
+
+  INSERT INTO public.activity_log (pql_id, action, details)
+  VALUES (p_pql_id, 'researched', COALESCE(p_activity_details, '{}'::jsonb));
+END;
+$$ LANGUAGE plpgsql SET search_path = public;